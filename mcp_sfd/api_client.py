@@ -8,29 +8,134 @@ connection pooling, and error mapping for communication with the FastAPI service
 import asyncio
 import logging
 import os
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 import httpx
+import orjson
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_HEADERS = {
+    "User-Agent": "mcp-sfd-client/1.0.0",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, br",
+}
+
 
 class MCPToolError(Exception):
-    """Custom exception for MCP tool errors."""
+    """Custom exception for MCP tool errors.
+
+    ``status_code`` is set when the error comes from an HTTP response.
+    """
 
-    def __init__(self, code: str, message: str):
+    def __init__(self, code: str, message: str, status_code: int | None = None):
         self.code = code
         self.message = message
+        self.status_code = status_code
         super().__init__(f"{code}: {message}")
 
 
+def _loads(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson, skipping httpx's text decode."""
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise MCPToolError(
+            "SCHEMA_VALIDATION_ERROR", f"Invalid JSON in response body: {e}"
+        ) from e
+
+
+class CircuitBreaker:
+    """Minimal CLOSED -> OPEN -> HALF_OPEN circuit breaker for upstream calls.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls immediately. Once ``recovery_time`` seconds have passed a
+    single trial call is let through; its outcome closes or re-opens the
+    breaker.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def before(self) -> None:
+        """Raise SERVICE_UNAVAILABLE if the call should not reach upstream."""
+        if self.state == "closed":
+            return
+        if (
+            self.state == "open"
+            and time.monotonic() - self._opened_at >= self.recovery_time
+        ):
+            self.state = "half_open"
+            logger.info("Circuit breaker half-open, allowing trial request")
+            return
+        raise MCPToolError(
+            "SERVICE_UNAVAILABLE",
+            "FastAPI service circuit breaker is open; failing fast",
+        )
+
+    def on_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        if self.state != "closed":
+            logger.info("Circuit breaker closed")
+        self.state = "closed"
+        self._failures = 0
+
+    def on_failure(self) -> None:
+        """Record a failed call, opening the breaker once over threshold."""
+        self._failures += 1
+        if self.state == "half_open" or self._failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning(
+                    "Circuit breaker opened",
+                    extra={
+                        "failures": self._failures,
+                        "recovery_time": self.recovery_time,
+                    },
+                )
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+
+# Bulkhead waits longer than this (seconds) are logged so MAX_INFLIGHT can be tuned
+_BULKHEAD_WAIT_WARNING = 0.1
+
+# Fraction of the TTL at the end of an entry's life during which it is still
+# served, but a background refresh is started (stale-while-revalidate)
+_REFRESH_WINDOW = 0.2
+
+_RequestKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """Cached successful response with monotonic timestamps."""
+
+    response: httpx.Response
+    stored_at: float
+    expires_at: float
+
+
 class SeattleAPIClient:
     """HTTP client for communicating with Seattle Fire Department FastAPI service."""
 
     def __init__(
-        self, base_url: str | None = None, timeout: int = 30, max_retries: int = 3
+        self,
+        base_url: str | None = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        cache_ttl: float = 15.0,
+        cache_max_entries: int = 256,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """
         Initialize the API client.
@@ -39,61 +144,248 @@ class SeattleAPIClient:
             base_url: Base URL for the FastAPI service
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            cache_ttl: How long successful GET responses are cached in seconds
+                (0 disables caching)
+            cache_max_entries: Maximum number of cached responses; the
+                oldest are evicted first
+            transport: Optional httpx transport override (e.g. MockTransport
+                in tests); bypasses the connection pool settings
         """
         self.base_url = base_url or os.getenv(
             "FASTAPI_BASE_URL", "http://localhost:8000"
         )
         self.timeout = timeout
         self.max_retries = max_retries
+        self.cache_ttl = cache_ttl
+        self.cache_max_entries = cache_max_entries
+        self._transport = transport
         self._client: httpx.AsyncClient | None = None
+        # In-flight GET requests keyed by (endpoint, params), shared by
+        # concurrent identical callers so they cost one upstream request
+        self._inflight: dict[_RequestKey, asyncio.Task[httpx.Response]] = {}
+        # Cached responses in write order, so with the default TTL the front is
+        # the next to expire
+        self._cache: OrderedDict[_RequestKey, _CacheEntry] = OrderedDict()
+        # Strong references to background refreshes so they aren't GC'd
+        self._refresh_tasks: set[asyncio.Task[httpx.Response]] = set()
+        self._breaker = CircuitBreaker()
+        # Bulkhead bounding concurrent upstream requests (cache hits and joined
+        # in-flight requests don't take a slot)
+        self.max_inflight = int(os.getenv("MAX_INFLIGHT", "64"))
+        self._bulkhead = asyncio.Semaphore(self.max_inflight)
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the httpx client with connection pooling."""
         if self._client is None:
             timeout = httpx.Timeout(self.timeout)
-            headers = {
-                "User-Agent": "mcp-sfd-client/1.0.0",
-                "Accept": "application/json",
-                "Accept-Encoding": "gzip, br",
-            }
 
-            # Configure connection pooling
+            # Configure connection pooling (sized for bursts of concurrent tool
+            # calls; keepalive matches the common 75s server-side default)
+            max_connections = int(os.getenv("HTTPX_MAX_CONNECTIONS", "256"))
+            max_keepalive = int(os.getenv("HTTPX_MAX_KEEPALIVE", "50"))
+            keepalive_expiry = float(os.getenv("HTTPX_KEEPALIVE_EXPIRY", "75.0"))
             limits = httpx.Limits(
-                max_keepalive_connections=10, max_connections=20, keepalive_expiry=30.0
+                max_keepalive_connections=max_keepalive,
+                max_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+
+            # HTTP/2 lets concurrent requests multiplex over one connection when
+            # the server negotiates it; plain-HTTP origins stay on HTTP/1.1
+            http2 = os.getenv("HTTPX_ENABLE_HTTP2", "true").lower() in (
+                "1",
+                "true",
+                "yes",
             )
 
             self._client = httpx.AsyncClient(
                 timeout=timeout,
-                headers=headers,
+                headers=_DEFAULT_HEADERS,
                 follow_redirects=True,
                 limits=limits,
+                http2=http2,
                 base_url=self.base_url or "http://localhost:8000",
+                transport=self._transport,
+            )
+            logger.info(
+                "HTTP connection pool configured",
+                extra={
+                    "max_connections": max_connections,
+                    "max_keepalive_connections": max_keepalive,
+                    "keepalive_expiry": keepalive_expiry,
+                    "http2": http2,
+                },
             )
         return self._client
 
     async def _make_request_with_retry(
-        self, method: str, endpoint: str, **kwargs: Any
+        self,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+        retries: int | None = None,
+        cache_ttl: float | None = None,
+        cache: bool = True,
+    ) -> httpx.Response:
+        """Make GET request, coalescing concurrent identical requests.
+
+        ``retries`` overrides ``max_retries`` for this call; 0 sends a single
+        attempt with no backoff. ``cache_ttl`` overrides the client's TTL for
+        this call: it caps the age of a cached response that may be served and
+        sets the lifetime of the response it stores. ``cache=False`` always
+        goes upstream and leaves the cache untouched.
+        """
+        key: _RequestKey = (endpoint, tuple(sorted(params.items())) if params else ())
+        if not cache:
+            ttl = 0.0
+        else:
+            ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+
+        entry = self._cache.get(key) if ttl > 0 else None
+        if entry is not None:
+            now = time.monotonic()
+            fresh_until = min(entry.expires_at, entry.stored_at + ttl)
+            if now < fresh_until:
+                refresh_at = fresh_until - ttl * _REFRESH_WINDOW
+                if now >= refresh_at and key not in self._inflight:
+                    # Serve the stale-but-valid entry, refresh in the background
+                    refresh = self._start_request(key, endpoint, params, retries, ttl)
+                    self._refresh_tasks.add(refresh)
+                    refresh.add_done_callback(self._on_refresh_done)
+                return entry.response
+            if now >= entry.expires_at:
+                del self._cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_request(key, endpoint, params, retries, ttl)
+        else:
+            logger.debug(
+                "Joining in-flight request",
+                extra={"endpoint": endpoint, "params": params},
+            )
+
+        # Shield so one caller being cancelled doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    def _start_request(
+        self,
+        key: _RequestKey,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        retries: int | None,
+        ttl: float,
+    ) -> asyncio.Task[httpx.Response]:
+        """Start a shared GET request that populates the response cache."""
+        task = asyncio.ensure_future(
+            self._fetch_and_cache(key, endpoint, params, retries, ttl)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def _fetch_and_cache(
+        self,
+        key: _RequestKey,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        retries: int | None,
+        ttl: float,
     ) -> httpx.Response:
-        """Make HTTP request with retry logic and exponential backoff."""
+        """Fetch a GET endpoint and cache the successful response for ``ttl``."""
+        response = await self._send_with_retry(endpoint, params, retries)
+        if ttl > 0:
+            now = time.monotonic()
+            self._cache[key] = _CacheEntry(
+                response=response,
+                stored_at=now,
+                expires_at=now + ttl,
+            )
+            self._cache.move_to_end(key)
+            self._evict_cache(now)
+        return response
+
+    def _evict_cache(self, now: float) -> None:
+        """Drop expired entries, then the oldest ones beyond cache_max_entries.
+
+        The sweep stops at the first live entry, so an entry stored with a
+        longer per-call TTL can shield expired ones behind it until they are
+        requested again or pushed out by the size limit.
+        """
+        cache = self._cache
+        while cache and next(iter(cache.values())).expires_at <= now:
+            cache.popitem(last=False)
+        while len(cache) > self.cache_max_entries:
+            cache.popitem(last=False)
+
+    def _on_refresh_done(self, task: asyncio.Task[httpx.Response]) -> None:
+        """Release a finished background refresh and log its failure, if any."""
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Background cache refresh failed",
+                extra={"error": str(task.exception())},
+            )
+
+    async def _send_with_retry(
+        self, endpoint: str, params: dict[str, Any] | None, retries: int | None
+    ) -> httpx.Response:
+        """Make HTTP request through the circuit breaker and bulkhead."""
+        self._breaker.before()
+        succeeded = False
+        try:
+            wait_start = time.monotonic()
+            async with self._bulkhead:
+                waited = time.monotonic() - wait_start
+                if waited > _BULKHEAD_WAIT_WARNING:
+                    logger.warning(
+                        "Request waited for bulkhead slot",
+                        extra={
+                            "endpoint": endpoint,
+                            "waited": waited,
+                            "max_inflight": self.max_inflight,
+                        },
+                    )
+                response = await self._send_with_backoff(endpoint, params, retries)
+            succeeded = True
+            return response
+        except MCPToolError as e:
+            # A 4xx means the service is up and answering; only 5xx, timeouts
+            # and connection errors count against the breaker
+            succeeded = e.status_code is not None and e.status_code < 500
+            raise
+        finally:
+            if succeeded:
+                self._breaker.on_success()
+            else:
+                self._breaker.on_failure()
+
+    async def _send_with_backoff(
+        self, endpoint: str, params: dict[str, Any] | None, retries: int | None
+    ) -> httpx.Response:
+        """Make GET request with retry logic and exponential backoff."""
         client = await self._get_client()
         last_exception: Exception | None = None
+        max_retries = self.max_retries if retries is None else retries
+        max_attempts = max_retries + 1  # +1 for initial attempt
 
-        for attempt in range(self.max_retries + 1):  # +1 for initial attempt
+        for attempt in range(max_attempts):
             try:
-                logger.debug(
-                    f"Making {method} request to {endpoint}",
-                    extra={
-                        "method": method,
-                        "endpoint": endpoint,
-                        "attempt": attempt + 1,
-                        "max_attempts": self.max_retries + 1,
-                    },
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Making GET request to %s",
+                        endpoint,
+                        extra={
+                            "endpoint": endpoint,
+                            "attempt": attempt + 1,
+                            "max_attempts": max_attempts,
+                        },
+                    )
 
-                response = await client.request(method, endpoint, **kwargs)
+                response = await client.get(endpoint, params=params)
 
                 logger.info(
-                    f"HTTP {method} request completed",
+                    "HTTP GET request completed",
                     extra={
                         "endpoint": endpoint,
                         "status_code": response.status_code,
@@ -108,17 +400,22 @@ class SeattleAPIClient:
                 # Handle 404 specifically
                 if response.status_code == 404:
                     raise MCPToolError(
-                        "RESOURCE_NOT_FOUND", f"Resource not found: {endpoint}"
+                        "RESOURCE_NOT_FOUND",
+                        f"Resource not found: {endpoint}",
+                        status_code=404,
                     )
 
                 # Retry on server errors (5xx) and some client errors
                 if (
                     response.status_code in (500, 502, 503, 504)
-                    and attempt < self.max_retries
+                    and attempt < max_retries
                 ):
-                    sleep_time = min(2**attempt, 32)  # Exponential backoff with max 32s
+                    # Full-jitter exponential backoff, capped at 32s
+                    sleep_time = random.uniform(0, min(2**attempt, 32))
                     logger.warning(
-                        f"Server error {response.status_code}, retrying in {sleep_time}s",
+                        "Server error %d, retrying in %.2fs",
+                        response.status_code,
+                        sleep_time,
                         extra={
                             "status_code": response.status_code,
                             "attempt": attempt + 1,
@@ -130,11 +427,10 @@ class SeattleAPIClient:
                     continue
 
                 # Non-retryable HTTP error
-                error_text = (
-                    response.text
-                    if len(response.text) < 500
-                    else response.text[:500] + "..."
-                )
+                # Decode only the prefix we log; error bodies can be large pages
+                error_text = response.content[:500].decode("utf-8", errors="replace")
+                if len(response.content) > 500:
+                    error_text += "..."
                 logger.error(
                     "HTTP error from FastAPI service",
                     extra={
@@ -146,14 +442,16 @@ class SeattleAPIClient:
                 raise MCPToolError(
                     "UPSTREAM_HTTP_ERROR",
                     f"FastAPI service returned HTTP {response.status_code}: {error_text}",
+                    status_code=response.status_code,
                 )
 
             except httpx.TimeoutException as e:
                 last_exception = e
-                if attempt < self.max_retries:
-                    sleep_time = min(2**attempt, 32)
+                if attempt < max_retries:
+                    sleep_time = random.uniform(0, min(2**attempt, 32))
                     logger.warning(
-                        f"Request timeout, retrying in {sleep_time}s",
+                        "Request timeout, retrying in %.2fs",
+                        sleep_time,
                         extra={
                             "attempt": attempt + 1,
                             "sleep_time": sleep_time,
@@ -163,27 +461,14 @@ class SeattleAPIClient:
                     await asyncio.sleep(sleep_time)
                     continue
 
-            except httpx.ConnectError as e:
-                last_exception = e
-                logger.error(
-                    "Connection error to FastAPI service",
-                    extra={
-                        "endpoint": endpoint,
-                        "error": str(e),
-                        "attempt": attempt + 1,
-                    },
-                )
-                raise MCPToolError(
-                    "SERVICE_UNAVAILABLE",
-                    f"Cannot connect to FastAPI service at {self.base_url}: {e}",
-                ) from e
-
             except httpx.RequestError as e:
+                # Includes ConnectError, which is often transient during restarts
                 last_exception = e
-                if attempt < self.max_retries:
-                    sleep_time = min(2**attempt, 32)
+                if attempt < max_retries:
+                    sleep_time = random.uniform(0, min(2**attempt, 32))
                     logger.warning(
-                        f"Network error, retrying in {sleep_time}s",
+                        "Network error, retrying in %.2fs",
+                        sleep_time,
                         extra={
                             "error": str(e),
                             "attempt": attempt + 1,
@@ -198,24 +483,38 @@ class SeattleAPIClient:
         if isinstance(last_exception, httpx.TimeoutException):
             logger.error(
                 "Request timed out after all retries",
-                extra={"endpoint": endpoint, "max_retries": self.max_retries},
+                extra={"endpoint": endpoint, "max_retries": max_retries},
             )
             raise MCPToolError(
                 "UPSTREAM_TIMEOUT",
-                f"FastAPI service request timed out after {self.max_retries} retries",
+                f"FastAPI service request timed out after {max_retries} retries",
+            )
+        elif isinstance(last_exception, httpx.ConnectError):
+            logger.error(
+                "Connection error to FastAPI service after all retries",
+                extra={
+                    "endpoint": endpoint,
+                    "error": str(last_exception),
+                    "max_retries": max_retries,
+                },
             )
+            raise MCPToolError(
+                "SERVICE_UNAVAILABLE",
+                f"Cannot connect to FastAPI service at {self.base_url}: "
+                f"{last_exception}",
+            ) from last_exception
         else:
             logger.error(
                 "Network error after all retries",
                 extra={
                     "error": str(last_exception),
                     "endpoint": endpoint,
-                    "max_retries": self.max_retries,
+                    "max_retries": max_retries,
                 },
             )
             raise MCPToolError(
                 "UPSTREAM_HTTP_ERROR",
-                f"Network error after {self.max_retries} retries: {last_exception}",
+                f"Network error after {max_retries} retries: {last_exception}",
             )
 
     def _validate_and_parse_incidents(self, data: Any) -> list[dict[str, Any]]:
@@ -230,11 +529,20 @@ class SeattleAPIClient:
         # we would validate each incident against the Incident model
         return data
 
-    async def get_active_incidents(self) -> list[dict[str, Any]]:
-        """Get currently active incidents from the FastAPI service."""
+    async def get_active_incidents(
+        self, cache_ttl: float | None = None
+    ) -> list[dict[str, Any]]:
+        """Get currently active incidents from the FastAPI service.
+
+        Args:
+            cache_ttl: Maximum age in seconds of a cached response to serve,
+                overriding the client's TTL (0 always fetches fresh data)
+        """
         try:
-            response = await self._make_request_with_retry("GET", "/incidents/active")
-            data = response.json()
+            response = await self._make_request_with_retry(
+                "/incidents/active", cache_ttl=cache_ttl
+            )
+            data = _loads(response)
             return self._validate_and_parse_incidents(data)
 
         except httpx.HTTPStatusError as e:
@@ -251,8 +559,8 @@ class SeattleAPIClient:
     async def get_all_incidents(self) -> list[dict[str, Any]]:
         """Get all incidents from the FastAPI service."""
         try:
-            response = await self._make_request_with_retry("GET", "/incidents/all")
-            data = response.json()
+            response = await self._make_request_with_retry("/incidents/all")
+            data = _loads(response)
             return self._validate_and_parse_incidents(data)
 
         except httpx.HTTPStatusError as e:
@@ -276,26 +584,24 @@ class SeattleAPIClient:
         priority: int | None = None,
     ) -> list[dict[str, Any]]:
         """Search incidents with filters."""
-        params = {}
-
-        if incident_type:
-            params["type"] = incident_type
-        if address_contains:
-            params["address"] = address_contains
-        if since:
-            params["since"] = since.isoformat()
-        if until:
-            params["until"] = until.isoformat()
-        if status:
-            params["status"] = status
-        if priority is not None:
-            params["priority"] = str(priority)
+        params = {
+            key: value
+            for key, value in (
+                ("type", incident_type),
+                ("address", address_contains),
+                ("since", since.isoformat() if since else None),
+                ("until", until.isoformat() if until else None),
+                ("status", status),
+                ("priority", None if priority is None else str(priority)),
+            )
+            if value
+        }
 
         try:
             response = await self._make_request_with_retry(
-                "GET", "/incidents/search", params=params
+                "/incidents/search", params=params
             )
-            data = response.json()
+            data = _loads(response)
             return self._validate_and_parse_incidents(data)
 
         except httpx.HTTPStatusError as e:
@@ -312,10 +618,8 @@ class SeattleAPIClient:
     async def get_incident(self, incident_id: str) -> dict[str, Any]:
         """Get a specific incident by ID."""
         try:
-            response = await self._make_request_with_retry(
-                "GET", f"/incidents/{incident_id}"
-            )
-            data = response.json()
+            response = await self._make_request_with_retry(f"/incidents/{incident_id}")
+            data = _loads(response)
 
             if not isinstance(data, dict):
                 raise MCPToolError(
@@ -340,11 +644,40 @@ class SeattleAPIClient:
                 f"Invalid response format for incident {incident_id}: {e}",
             ) from e
 
+    async def get_many(
+        self, incident_ids: list[str]
+    ) -> list[dict[str, Any] | MCPToolError]:
+        """
+        Get several incidents by ID concurrently.
+
+        Args:
+            incident_ids: Incident IDs to fetch
+
+        Returns:
+            One item per ID, in order: the incident object, or the MCPToolError
+            raised while fetching it, so one bad ID doesn't fail the batch
+        """
+        results = await asyncio.gather(
+            *(self.get_incident(incident_id) for incident_id in incident_ids),
+            return_exceptions=True,
+        )
+
+        items: list[dict[str, Any] | MCPToolError] = []
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, MCPToolError
+            ):
+                raise result
+            items.append(result)
+        return items
+
     async def get_health(self) -> dict[str, Any]:
-        """Get service health status."""
+        """Get service health status, always probing the upstream directly."""
         try:
-            response = await self._make_request_with_retry("GET", "/health")
-            data = response.json()
+            response = await self._make_request_with_retry(
+                "/health", retries=0, cache=False
+            )
+            data = _loads(response)
 
             if not isinstance(data, dict):
                 raise MCPToolError(
@@ -367,34 +700,43 @@ class SeattleAPIClient:
 
     async def close(self) -> None:
         """Close the HTTP client and clean up resources."""
+        for task in self._refresh_tasks:
+            task.cancel()
+        self._refresh_tasks.clear()
+        self._cache.clear()
         if self._client:
             await self._client.aclose()
             self._client = None
             logger.info("FastAPI client closed")
 
 
-# Global client instance
+# Global client instance; get_client() never awaits between checking and
+# setting it, so concurrent callers on the event loop share one instance
 _client: SeattleAPIClient | None = None
 
 
+def _client_from_env() -> SeattleAPIClient:
+    """Create a client configured from environment variables."""
+    return SeattleAPIClient(
+        base_url=os.getenv("FASTAPI_BASE_URL", "http://localhost:8000"),
+        timeout=int(os.getenv("REQUEST_TIMEOUT", "30")),
+        max_retries=int(os.getenv("MAX_RETRIES", "3")),
+        cache_ttl=float(os.getenv("DEFAULT_CACHE_TTL", "15")),
+    )
+
+
 async def get_client() -> SeattleAPIClient:
     """Get the global FastAPI client instance."""
     global _client
     if _client is None:
-        # Load configuration from environment
-        base_url = os.getenv("FASTAPI_BASE_URL", "http://localhost:8000")
-        timeout = int(os.getenv("REQUEST_TIMEOUT", "30"))
-        max_retries = int(os.getenv("MAX_RETRIES", "3"))
-
-        _client = SeattleAPIClient(
-            base_url=base_url, timeout=timeout, max_retries=max_retries
-        )
+        _client = _client_from_env()
         logger.info(
             "FastAPI client initialized",
             extra={
-                "base_url": base_url,
-                "timeout": timeout,
-                "max_retries": max_retries,
+                "base_url": _client.base_url,
+                "timeout": _client.timeout,
+                "max_retries": _client.max_retries,
+                "cache_ttl": _client.cache_ttl,
             },
         )
     return _client
@@ -403,6 +745,7 @@ async def get_client() -> SeattleAPIClient:
 async def close_client() -> None:
     """Close the global FastAPI client instance."""
     global _client
-    if _client:
-        await _client.close()
-        _client = None
+    # Detach before closing so callers during the close get a fresh client
+    client, _client = _client, None
+    if client:
+        await client.close()
@@ -7,30 +7,28 @@ live incident data through the Model Context Protocol.
 
 import asyncio
 import logging
+import os
 import sys
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
+from .api_client import close_client
+
 # Import tool implementations
 from .tools.get_active_incidents import get_active_incidents
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
-
 logger = logging.getLogger("mcp-sfd")
 
 # Create the MCP server
 server = Server("mcp-sfd")
 
 # Tool definitions with schemas
-TOOLS = [
+TOOLS: tuple[Tool, ...] = (
     Tool(
         name="seattle.get_active_incidents",
         description="Get currently active incidents from Seattle Fire Department",
@@ -39,7 +37,10 @@ TOOLS = [
             "properties": {
                 "cache_ttl_seconds": {
                     "type": "integer",
-                    "description": "Cache TTL override in seconds (default: 15)",
+                    "description": (
+                        "Maximum age in seconds of cached data to return; "
+                        "0 always fetches fresh data (default: 15)"
+                    ),
                     "minimum": 0,
                     "maximum": 300,
                     "default": 15,
@@ -47,14 +48,41 @@ TOOLS = [
             },
             "additionalProperties": False,
         },
+    ),
+)
+
+# Tool name -> implementation
+_DISPATCH: dict[str, Callable[[dict[str, Any]], Awaitable[list[TextContent]]]] = {
+    "seattle.get_active_incidents": get_active_incidents,
+}
+
+# Token bucket for full tracebacks on unexpected errors: a burst of 20, then
+# one per second, so a client spamming failing calls can't make traceback
+# formatting the bottleneck
+_TRACEBACK_BURST = 20.0
+_traceback_tokens = _TRACEBACK_BURST
+_traceback_refilled_at = time.monotonic()
+
+
+def _take_traceback_token() -> bool:
+    """Return True if an unexpected-error log may include its traceback."""
+    global _traceback_tokens, _traceback_refilled_at
+
+    now = time.monotonic()
+    _traceback_tokens = min(
+        _TRACEBACK_BURST, _traceback_tokens + (now - _traceback_refilled_at)
     )
-]
+    _traceback_refilled_at = now
+    if _traceback_tokens < 1.0:
+        return False
+    _traceback_tokens -= 1.0
+    return True
 
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools."""
-    return TOOLS
+    return list(TOOLS)
 
 
 @server.call_tool()
@@ -63,60 +91,71 @@ async def call_tool(name: str, arguments: dict[str, Any] | None) -> list[TextCon
     if arguments is None:
         arguments = {}
 
-    logger.info(f"Tool called: {name}", extra={"tool": name, "arguments": arguments})
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Tool called: %s", name, extra={"tool": name, "arguments": arguments}
+        )
 
     try:
         # Route to tool implementations
-        if name == "seattle.get_active_incidents":
-            return await get_active_incidents(arguments)
-        else:
-            logger.error(f"Unknown tool: {name}")
+        handler = _DISPATCH.get(name)
+        if handler is None:
+            logger.error("Unknown tool: %s", name)
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
 
     except ValueError as e:
         # Handle validation errors
         error_msg = f"Validation error: {str(e)}"
         logger.error(
-            f"Tool {name} failed with validation error",
+            "Tool %s failed with validation error",
+            name,
             extra={
                 "tool": name,
                 "error": str(e),
                 "status": "error",
             },
         )
-        return [TextContent(type="text", text=error_msg)]
+        return [TextContent.model_construct(type="text", text=error_msg)]
 
     except Exception as e:
         # Handle unexpected errors
         error_msg = f"Unexpected error: {str(e)}"
+        with_traceback = _take_traceback_token()
         logger.error(
-            f"Tool {name} failed with unexpected error",
+            "Tool %s failed with unexpected error",
+            name,
             extra={
                 "tool": name,
                 "error": str(e),
                 "status": "error",
+                "traceback_suppressed": not with_traceback,
             },
-            exc_info=True,
+            exc_info=with_traceback,
         )
-        return [TextContent(type="text", text=error_msg)]
+        return [TextContent.model_construct(type="text", text=error_msg)]
 
 
 async def cleanup() -> None:
     """Cleanup resources on shutdown."""
     logger.info("Shutting down MCP server")
     # Clean up FastAPI client connections
-    from .api_client import close_client
-
     await close_client()
 
 
 async def main() -> None:
     """Main entry point for the MCP server."""
+    # Configure logging here rather than at import so embedding or importing
+    # the module (e.g. from tests) leaves the root logger alone
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+
     logger.info("Starting MCP SFD server")
 
     # Log configuration
-    import os
-
     logger.info(
         "Server configuration",
         extra={
@@ -135,7 +174,7 @@ async def main() -> None:
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
         raise
     finally:
         await cleanup()
@@ -144,12 +183,17 @@ async def main() -> None:
 def cli_main() -> None:
     """CLI entry point for the server."""
     try:
-        asyncio.run(main())
+        try:
+            import uvloop
+        except ImportError:  # Windows, or installed without uvloop
+            asyncio.run(main())
+        else:
+            uvloop.run(main())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Failed to start server: {e}")
+        logger.error("Failed to start server: %s", e)
         sys.exit(1)
 
 
@@ -0,0 +1,15 @@
+"""Shared test configuration for MCP server tests."""
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # e.g. Windows, where uvloop is not a dependency
+    uvloop = None
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop, like cli_main() does."""
+        return {"uvloop": uvloop.new_event_loop}
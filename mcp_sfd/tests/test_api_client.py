@@ -5,71 +5,177 @@ Tests cover HTTP client functionality, retry logic, error handling,
 response validation, and connection management.
 """
 
-import os
-from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from datetime import UTC, datetime, timedelta, timezone
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import httpx
 import pytest
 
-from mcp_sfd.api_client import MCPToolError, SeattleAPIClient, close_client, get_client
+from mcp_sfd.api_client import (
+    MCPToolError,
+    SeattleAPIClient,
+    _client_from_env,
+    close_client,
+    get_client,
+)
+
+# Shared read-only payloads; tests compare against them but never mutate them
+SAMPLE_INCIDENTS = [
+    {
+        "incident_id": "F240001234",
+        "incident_datetime": "2024-01-01T10:30:00Z",
+        "priority": 3,
+        "units": ["E17", "L9"],
+        "address": "123 Test St",
+        "incident_type": "Aid Response",
+        "status": "active",
+        "first_seen": "2024-01-01T10:30:00Z",
+        "last_seen": "2024-01-01T10:35:00Z",
+        "closed_at": None,
+    },
+    {
+        "incident_id": "F240001235",
+        "incident_datetime": "2024-01-01T11:00:00Z",
+        "priority": 1,
+        "units": ["E12", "E15", "L3"],
+        "address": "456 Emergency Ave",
+        "incident_type": "Structure Fire",
+        "status": "active",
+        "first_seen": "2024-01-01T11:00:00Z",
+        "last_seen": "2024-01-01T11:05:00Z",
+        "closed_at": None,
+    },
+]
+
+SAMPLE_INCIDENT = {
+    "incident_id": "F240001234",
+    "incident_type": "Aid Response",
+    "status": "active",
+}
+
+# search_incidents() filters and the query parameters they should map to
+SEARCH_SINCE = datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC)
+SEARCH_KWARGS = MappingProxyType(
+    {
+        "incident_type": "Structure Fire",
+        "address_contains": "Test",
+        "since": SEARCH_SINCE,
+        "priority": 1,
+    }
+)
+EXPECTED_SEARCH_PARAMS = MappingProxyType(
+    {
+        "type": "Structure Fire",
+        "address": "Test",
+        "since": "2024-01-01T10:00:00+00:00",
+        "priority": "1",
+    }
+)
+
+SAMPLE_HEALTH = {
+    "status": "healthy",
+    "service": "seattle-fire-api",
+    "version": "1.0.0",
+    "config": {"polling_interval": 300, "cache_enabled": True},
+}
+
+
+@pytest.fixture(scope="session")
+def sample_incident_data():
+    """Sample incident data for testing."""
+    return SAMPLE_INCIDENTS
+
+
+@pytest.fixture(scope="session")
+def sample_incident():
+    """Single incident payload for testing."""
+    return SAMPLE_INCIDENT
+
+
+@pytest.fixture(scope="session")
+def sample_health_data():
+    """Sample health status data for testing."""
+    return SAMPLE_HEALTH
+
+
+@pytest.fixture(autouse=True)
+def sleep_log(monkeypatch):
+    """Record requested sleep durations instead of actually waiting."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0)  # Still yield so concurrency tests interleave
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+class FakeUpstream:
+    """httpx.MockTransport handler replaying canned outcomes in order.
+
+    Outcomes are responses, exceptions to raise, or async callables producing a
+    response; the last outcome keeps repeating once the others are used up.
+    """
+
+    def __init__(self):
+        self.outcomes = []
+        self.requests = []
+
+    def reply(self, *outcomes):
+        """Set the outcomes for the next requests."""
+        self.outcomes = list(outcomes)
+
+    @property
+    def call_count(self):
+        return len(self.requests)
+
+    async def __call__(self, request):
+        self.requests.append(request)
+        if len(self.outcomes) > 1:
+            outcome = self.outcomes.pop(0)
+        else:
+            outcome = self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        if callable(outcome):
+            outcome = await outcome(request)
+        # Fresh copy so a repeated outcome isn't bound to an earlier request
+        return httpx.Response(
+            outcome.status_code, headers=outcome.headers, content=outcome.content
+        )
 
 
-class TestSeattleAPIClient:
-    """Test cases for SeattleAPIClient."""
+@pytest.fixture
+def upstream():
+    """Fake FastAPI service behind an httpx.MockTransport."""
+    return FakeUpstream()
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client instance."""
-        return SeattleAPIClient(
-            base_url="http://test-api:8000", timeout=5, max_retries=2
-        )
 
-    @pytest.fixture
-    def mock_httpx_client(self):
-        """Create a mock httpx client."""
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        return mock_client
+@pytest.fixture
+def mocked_retry(client):
+    """Patch the client's request layer; tests set return_value/side_effect."""
+    with patch.object(client, "_make_request_with_retry") as mock_request:
+        yield mock_request
 
-    @pytest.fixture
-    def sample_incident_data(self):
-        """Sample incident data for testing."""
-        return [
-            {
-                "incident_id": "F240001234",
-                "incident_datetime": "2024-01-01T10:30:00Z",
-                "priority": 3,
-                "units": ["E17", "L9"],
-                "address": "123 Test St",
-                "incident_type": "Aid Response",
-                "status": "active",
-                "first_seen": "2024-01-01T10:30:00Z",
-                "last_seen": "2024-01-01T10:35:00Z",
-                "closed_at": None,
-            },
-            {
-                "incident_id": "F240001235",
-                "incident_datetime": "2024-01-01T11:00:00Z",
-                "priority": 1,
-                "units": ["E12", "E15", "L3"],
-                "address": "456 Emergency Ave",
-                "incident_type": "Structure Fire",
-                "status": "active",
-                "first_seen": "2024-01-01T11:00:00Z",
-                "last_seen": "2024-01-01T11:05:00Z",
-                "closed_at": None,
-            },
-        ]
+
+class TestSeattleAPIClient:
+    """Test cases for SeattleAPIClient."""
 
     @pytest.fixture
-    def sample_health_data(self):
-        """Sample health status data for testing."""
-        return {
-            "status": "healthy",
-            "service": "seattle-fire-api",
-            "version": "1.0.0",
-            "config": {"polling_interval": 300, "cache_enabled": True},
-        }
+    async def client(self, upstream):
+        """Create a test client instance talking to the fake upstream."""
+        client = SeattleAPIClient(
+            base_url="http://test-api:8000",
+            timeout=5,
+            max_retries=2,
+            transport=httpx.MockTransport(upstream),
+        )
+        yield client
+        await client.close()
 
     async def test_client_initialization(self, client):
         """Test client initialization with custom parameters."""
@@ -78,24 +184,19 @@ class TestSeattleAPIClient:
         assert client.max_retries == 2
         assert client._client is None
 
-    async def test_client_creation_from_environment(self):
+    async def test_client_creation_from_environment(self, monkeypatch):
         """Test client creation with environment variables."""
-        with patch.dict(
-            "os.environ",
-            {
-                "FASTAPI_BASE_URL": "http://env-api:9000",
-                "REQUEST_TIMEOUT": "60",
-                "MAX_RETRIES": "5",
-            },
-        ):
-            client = SeattleAPIClient(
-                base_url=os.getenv("FASTAPI_BASE_URL"),
-                timeout=int(os.getenv("REQUEST_TIMEOUT", "30")),
-                max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            )
-            assert client.base_url == "http://env-api:9000"
-            assert client.timeout == 60
-            assert client.max_retries == 5
+        monkeypatch.setenv("FASTAPI_BASE_URL", "http://env-api:9000")
+        monkeypatch.setenv("REQUEST_TIMEOUT", "60")
+        monkeypatch.setenv("MAX_RETRIES", "5")
+        monkeypatch.setenv("DEFAULT_CACHE_TTL", "2.5")
+
+        client = _client_from_env()
+
+        assert client.base_url == "http://env-api:9000"
+        assert client.timeout == 60
+        assert client.max_retries == 5
+        assert client.cache_ttl == 2.5
 
     @patch("mcp_sfd.api_client.httpx.AsyncClient")
     async def test_get_client_creates_client(self, mock_async_client_class, client):
@@ -123,232 +224,377 @@ class TestSeattleAPIClient:
         assert headers["User-Agent"] == "mcp-sfd-client/1.0.0"
         assert headers["Accept"] == "application/json"
 
-    async def test_successful_get_active_incidents(self, client, sample_incident_data):
-        """Test successful retrieval of active incidents."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_incident_data
-
-        with patch.object(
-            client, "_make_request_with_retry", return_value=mock_response
-        ):
-            result = await client.get_active_incidents()
-
-            assert result == sample_incident_data
-            client._make_request_with_retry.assert_called_once_with(
-                "GET", "/incidents/active"
-            )
-
-    async def test_successful_get_all_incidents(self, client, sample_incident_data):
-        """Test successful retrieval of all incidents."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_incident_data
-
-        with patch.object(
-            client, "_make_request_with_retry", return_value=mock_response
-        ):
-            result = await client.get_all_incidents()
-
-            assert result == sample_incident_data
-            client._make_request_with_retry.assert_called_once_with(
-                "GET", "/incidents/all"
-            )
-
-    async def test_successful_search_incidents(self, client, sample_incident_data):
-        """Test successful incident search with filters."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_incident_data
-
-        search_params = {
-            "incident_type": "Structure Fire",
-            "address_contains": "Test",
-            "since": datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
-            "priority": 1,
-        }
-
-        expected_params = {
-            "type": "Structure Fire",
-            "address": "Test",
-            "since": "2024-01-01T10:00:00+00:00",
-            "priority": "1",
-        }
-
-        with patch.object(
-            client, "_make_request_with_retry", return_value=mock_response
-        ):
-            result = await client.search_incidents(**search_params)
-
-            assert result == sample_incident_data
-            client._make_request_with_retry.assert_called_once_with(
-                "GET", "/incidents/search", params=expected_params
-            )
-
-    async def test_successful_get_incident(self, client):
-        """Test successful retrieval of specific incident."""
-        incident_data = {
-            "incident_id": "F240001234",
-            "incident_type": "Aid Response",
-            "status": "active",
-        }
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = incident_data
-
-        with patch.object(
-            client, "_make_request_with_retry", return_value=mock_response
-        ):
-            result = await client.get_incident("F240001234")
-
-            assert result == incident_data
-            client._make_request_with_retry.assert_called_once_with(
-                "GET", "/incidents/F240001234"
-            )
-
-    async def test_successful_get_health(self, client, sample_health_data):
-        """Test successful health status retrieval."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_health_data
-
-        with patch.object(
-            client, "_make_request_with_retry", return_value=mock_response
-        ):
-            result = await client.get_health()
-
-            assert result == sample_health_data
-            client._make_request_with_retry.assert_called_once_with("GET", "/health")
-
-    async def test_retry_logic_with_server_errors(self, client):
+        # Check default connection pool limits
+        limits = call_kwargs["limits"]
+        assert limits.max_connections == 256
+        assert limits.max_keepalive_connections == 50
+        assert limits.keepalive_expiry == 75.0
+        assert call_kwargs["http2"] is True
+
+    @patch("mcp_sfd.api_client.httpx.AsyncClient")
+    async def test_get_client_limits_from_environment(
+        self, mock_async_client_class, client, monkeypatch
+    ):
+        """Test that connection pool limits can be overridden via environment."""
+        mock_async_client_class.return_value = AsyncMock()
+        monkeypatch.setenv("HTTPX_MAX_CONNECTIONS", "64")
+        monkeypatch.setenv("HTTPX_MAX_KEEPALIVE", "8")
+        monkeypatch.setenv("HTTPX_KEEPALIVE_EXPIRY", "10.5")
+
+        await client._get_client()
+
+        limits = mock_async_client_class.call_args.kwargs["limits"]
+        assert limits.max_connections == 64
+        assert limits.max_keepalive_connections == 8
+        assert limits.keepalive_expiry == 10.5
+
+    @patch("mcp_sfd.api_client.httpx.AsyncClient")
+    async def test_get_client_http2_opt_out(
+        self, mock_async_client_class, client, monkeypatch
+    ):
+        """Test that HTTP/2 can be disabled via environment."""
+        mock_async_client_class.return_value = AsyncMock()
+        monkeypatch.setenv("HTTPX_ENABLE_HTTP2", "false")
+
+        await client._get_client()
+
+        assert mock_async_client_class.call_args.kwargs["http2"] is False
+
+    @pytest.mark.parametrize(
+        "method, kwargs, payload, expected_call",
+        [
+            (
+                "get_active_incidents",
+                {},
+                "sample_incident_data",
+                call("/incidents/active", cache_ttl=None),
+            ),
+            ("get_all_incidents", {}, "sample_incident_data", call("/incidents/all")),
+            (
+                "search_incidents",
+                SEARCH_KWARGS,
+                "sample_incident_data",
+                call("/incidents/search", params=EXPECTED_SEARCH_PARAMS),
+            ),
+            (
+                "get_incident",
+                {"incident_id": "F240001234"},
+                "sample_incident",
+                call("/incidents/F240001234"),
+            ),
+            (
+                "get_health",
+                {},
+                "sample_health_data",
+                call("/health", retries=0, cache=False),
+            ),
+        ],
+    )
+    async def test_successful_get(
+        self, request, client, mocked_retry, method, kwargs, payload, expected_call
+    ):
+        """Test that each endpoint requests the right path and returns its data."""
+        data = request.getfixturevalue(payload)
+        mocked_retry.return_value = httpx.Response(200, json=data)
+
+        result = await getattr(client, method)(**kwargs)
+
+        assert result == data
+        assert mocked_retry.call_args_list == [expected_call]
+
+    async def test_search_preserves_since_offset(self, client, mocked_retry):
+        """Test that equal instants in different offsets keep their own offset."""
+        mocked_retry.return_value = httpx.Response(200, json=[])
+        pacific = timezone(timedelta(hours=-8))
+
+        await client.search_incidents(since=datetime(2024, 1, 1, 12, tzinfo=UTC))
+        await client.search_incidents(since=datetime(2024, 1, 1, 4, tzinfo=pacific))
+
+        assert [c.kwargs["params"]["since"] for c in mocked_retry.call_args_list] == [
+            "2024-01-01T12:00:00+00:00",
+            "2024-01-01T04:00:00-08:00",
+        ]
+
+    async def test_get_health_does_not_retry(self, client, upstream, sleep_log):
+        """Test that health checks fail after a single attempt."""
+        upstream.reply(httpx.TimeoutException("timeout"))
+
+        with pytest.raises(MCPToolError) as exc_info:
+            await client.get_health()
+
+        assert exc_info.value.code == "UPSTREAM_TIMEOUT"
+        assert upstream.call_count == 1
+        assert sleep_log == []
+
+    async def test_get_health_bypasses_cache(
+        self, client, upstream, sample_health_data
+    ):
+        """Test that a health check never reports a cached upstream state."""
+        upstream.reply(
+            httpx.Response(200, json=sample_health_data),
+            httpx.ConnectError("connection refused"),
+        )
+
+        assert await client.get_health() == sample_health_data
+
+        # The upstream went down between the two probes
+        with pytest.raises(MCPToolError) as exc_info:
+            await client.get_health()
+
+        assert exc_info.value.code == "SERVICE_UNAVAILABLE"
+        assert upstream.call_count == 2
+        assert client._cache == {}
+
+    async def test_retry_logic_with_server_errors(self, client, upstream):
         """Test retry logic for server errors (5xx)."""
         # Mock responses: 503, 503, 200 (success on third attempt)
         responses = [
-            MagicMock(status_code=503, text="Service Unavailable"),
-            MagicMock(status_code=503, text="Service Unavailable"),
-            MagicMock(status_code=200, json=lambda: []),
+            httpx.Response(503, text="Service Unavailable"),
+            httpx.Response(503, text="Service Unavailable"),
+            httpx.Response(200, json=[]),
         ]
 
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.request.side_effect = responses
-            mock_get_client.return_value = mock_client
+        upstream.reply(*responses)
+
+        result = await client._make_request_with_retry("/test")
+
+        assert result.status_code == 200
+        assert upstream.call_count == 3
+
+    @pytest.mark.parametrize(
+        "outcome, expected_code, needle, expected_calls",
+        [
+            # Retryable failures use the initial attempt + 2 retries
+            (
+                httpx.Response(503, text="Service Unavailable"),
+                "UPSTREAM_HTTP_ERROR",
+                "503",
+                3,
+            ),
+            (
+                httpx.TimeoutException("Request timed out"),
+                "UPSTREAM_TIMEOUT",
+                "timed out",
+                3,
+            ),
+            (
+                httpx.ConnectError("Connection failed"),
+                "SERVICE_UNAVAILABLE",
+                "Cannot connect",
+                3,
+            ),
+            # Client errors fail on the first attempt
+            (
+                httpx.Response(404, text="Not Found"),
+                "RESOURCE_NOT_FOUND",
+                "not found",
+                1,
+            ),
+            (httpx.Response(400, text="Bad Request"), "UPSTREAM_HTTP_ERROR", "400", 1),
+        ],
+        ids=["server-error", "timeout", "connect-error", "not-found", "bad-request"],
+    )
+    async def test_request_failure_handling(
+        self, client, upstream, outcome, expected_code, needle, expected_calls
+    ):
+        """Test how each kind of upstream failure is mapped and retried."""
+        upstream.reply(outcome)
 
-            with patch("asyncio.sleep"):  # Mock sleep to speed up test
-                result = await client._make_request_with_retry("GET", "/test")
+        with pytest.raises(MCPToolError) as exc_info:
+            await client._make_request_with_retry("/test")
 
-            assert result.status_code == 200
-            assert mock_client.request.call_count == 3
+        assert exc_info.value.code == expected_code
+        assert needle in exc_info.value.message
+        assert upstream.call_count == expected_calls
 
-    async def test_retry_exhaustion_with_server_errors(self, client):
-        """Test retry exhaustion with persistent server errors."""
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.request.return_value = MagicMock(
-                status_code=503, text="Service Unavailable"
-            )
-            mock_get_client.return_value = mock_client
+    async def test_connection_error_recovers_on_retry(
+        self, client, upstream, sample_health_data
+    ):
+        """Test that a transient connection error is retried."""
+        upstream.reply(
+            httpx.ConnectError("Connection failed"),
+            httpx.Response(200, json=sample_health_data),
+        )
 
-            with patch("asyncio.sleep"):  # Mock sleep to speed up test
-                with pytest.raises(MCPToolError) as exc_info:
-                    await client._make_request_with_retry("GET", "/test")
+        response = await client._make_request_with_retry("/health")
 
-            assert exc_info.value.code == "UPSTREAM_HTTP_ERROR"
-            assert "503" in str(exc_info.value.message)
-            assert mock_client.request.call_count == 3  # Initial + 2 retries
-
-    async def test_timeout_handling(self, client):
-        """Test timeout error handling and retries."""
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.request.side_effect = httpx.TimeoutException(
-                "Request timed out"
-            )
-            mock_get_client.return_value = mock_client
-
-            with patch("asyncio.sleep"):  # Mock sleep to speed up test
-                with pytest.raises(MCPToolError) as exc_info:
-                    await client._make_request_with_retry("GET", "/test")
-
-            assert exc_info.value.code == "UPSTREAM_TIMEOUT"
-            assert "timed out" in str(exc_info.value.message)
-            assert mock_client.request.call_count == 3  # Initial + 2 retries
-
-    async def test_connection_error_handling(self, client):
-        """Test connection error handling."""
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.request.side_effect = httpx.ConnectError("Connection failed")
-            mock_get_client.return_value = mock_client
+        assert response.status_code == 200
+        assert upstream.call_count == 2
 
-            with pytest.raises(MCPToolError) as exc_info:
-                await client._make_request_with_retry("GET", "/test")
-
-            assert exc_info.value.code == "SERVICE_UNAVAILABLE"
-            assert "Cannot connect" in str(exc_info.value.message)
-            assert (
-                mock_client.request.call_count == 1
-            )  # No retries for connection errors
-
-    async def test_404_error_handling(self, client):
-        """Test 404 error handling."""
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.request.return_value = MagicMock(
-                status_code=404, text="Not Found"
-            )
-            mock_get_client.return_value = mock_client
+    async def test_circuit_breaker_fails_fast_when_open(self, client, upstream):
+        """Test that repeated upstream failures open the circuit breaker."""
+        upstream.reply(httpx.ConnectError("Connection failed"))
 
-            with pytest.raises(MCPToolError) as exc_info:
-                await client._make_request_with_retry("GET", "/incidents/nonexistent")
+        for i in range(client._breaker.failure_threshold):
+            with pytest.raises(MCPToolError):
+                await client._make_request_with_retry(f"/test/{i}")
 
-            assert exc_info.value.code == "RESOURCE_NOT_FOUND"
-            assert mock_client.request.call_count == 1  # No retries for 404
+        assert client._breaker.state == "open"
+        calls_before = upstream.call_count
 
-    async def test_client_error_no_retry(self, client):
-        """Test that 4xx errors (except 404) don't trigger retries."""
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.request.return_value = MagicMock(
-                status_code=400, text="Bad Request"
-            )
-            mock_get_client.return_value = mock_client
+        with pytest.raises(MCPToolError) as exc_info:
+            await client._make_request_with_retry("/test/next")
 
-            with pytest.raises(MCPToolError) as exc_info:
-                await client._make_request_with_retry("GET", "/test")
+        assert exc_info.value.code == "SERVICE_UNAVAILABLE"
+        assert "circuit breaker" in exc_info.value.message
+        assert upstream.call_count == calls_before
+
+    async def test_circuit_breaker_recovers_after_trial_request(
+        self, client, upstream, sample_health_data
+    ):
+        """Test that a successful half-open trial request closes the breaker."""
+        client._breaker.state = "open"
+        client._breaker._failures = client._breaker.failure_threshold
+        client._breaker._opened_at = -client._breaker.recovery_time
+
+        upstream.reply(httpx.Response(200, json=sample_health_data))
+
+        await client._make_request_with_retry("/health")
 
+        assert client._breaker.state == "closed"
+        assert client._breaker._failures == 0
+
+    async def test_circuit_breaker_ignores_not_found(self, client, upstream):
+        """Test that 404 responses don't count as upstream failures."""
+        upstream.reply(httpx.Response(404, text="Not Found"))
+
+        for i in range(client._breaker.failure_threshold):
+            with pytest.raises(MCPToolError):
+                await client._make_request_with_retry(f"/incidents/{i}")
+
+        assert client._breaker.state == "closed"
+
+    @pytest.mark.parametrize("status_code", [400, 422, 429])
+    async def test_circuit_breaker_ignores_client_errors(
+        self, client, upstream, status_code
+    ):
+        """Test that 4xx responses don't open the breaker for other calls."""
+        upstream.reply(httpx.Response(status_code, text="Bad Request"))
+
+        for i in range(client._breaker.failure_threshold):
+            with pytest.raises(MCPToolError) as exc_info:
+                await client._make_request_with_retry(f"/incidents/search?{i}")
             assert exc_info.value.code == "UPSTREAM_HTTP_ERROR"
-            assert "400" in str(exc_info.value.message)
-            assert mock_client.request.call_count == 1  # No retries for 400
+            assert exc_info.value.status_code == status_code
+
+        assert client._breaker.state == "closed"
+
+        # Healthy calls still reach upstream
+        upstream.reply(httpx.Response(200, json=[]))
+        await client._make_request_with_retry("/incidents/active")
+        assert client._breaker.state == "closed"
+
+    async def test_circuit_breaker_counts_unretried_server_errors(
+        self, client, upstream
+    ):
+        """Test that non-retryable 5xx responses still count as failures."""
+        upstream.reply(httpx.Response(501, text="Not Implemented"))
+
+        for i in range(client._breaker.failure_threshold):
+            with pytest.raises(MCPToolError):
+                await client._make_request_with_retry(f"/test/{i}")
+
+        assert client._breaker.state == "open"
+
+    async def test_bulkhead_bounds_concurrent_requests(
+        self, upstream, sample_health_data, monkeypatch
+    ):
+        """Test that MAX_INFLIGHT caps concurrent upstream requests."""
+        monkeypatch.setenv("MAX_INFLIGHT", "2")
+        client = SeattleAPIClient(
+            base_url="http://test-api:8000",
+            transport=httpx.MockTransport(upstream),
+        )
+        assert client.max_inflight == 2
+
+        active = 0
+        peak = 0
+
+        async def slow_request(*args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json=sample_health_data)
+
+        upstream.reply(slow_request)
+
+        await asyncio.gather(
+            *(client._make_request_with_retry(f"/test/{i}") for i in range(6))
+        )
+
+        assert upstream.call_count == 6
+        assert peak == 2
+
+        await client.close()
+
+    async def test_large_error_body_is_truncated(self, client, upstream):
+        """Test that only the first 500 bytes of an error body are reported."""
+        upstream.reply(httpx.Response(400, text="x" * 10_000))
 
-    async def test_invalid_response_data_validation(self, client):
+        with pytest.raises(MCPToolError) as exc_info:
+            await client._make_request_with_retry("/test")
+
+        assert exc_info.value.message.endswith("x" * 500 + "...")
+        assert "x" * 501 not in exc_info.value.message
+
+    async def test_invalid_response_data_validation(self, client, mocked_retry):
         """Test validation of invalid response data."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = "invalid_data"  # Should be list
+        # Should be a list
+        mocked_retry.return_value = httpx.Response(200, json="invalid_data")
 
-        with patch.object(
-            client, "_make_request_with_retry", return_value=mock_response
-        ):
-            with pytest.raises(MCPToolError) as exc_info:
-                await client.get_active_incidents()
+        with pytest.raises(MCPToolError) as exc_info:
+            await client.get_active_incidents()
 
-            assert exc_info.value.code == "SCHEMA_VALIDATION_ERROR"
-            assert "Expected list" in str(exc_info.value.message)
+        assert exc_info.value.code == "SCHEMA_VALIDATION_ERROR"
+        assert "Expected list" in str(exc_info.value.message)
+
+    async def test_invalid_json_response(self, client, mocked_retry):
+        """Test that undecodable response bodies map to schema errors."""
+        mocked_retry.return_value = httpx.Response(
+            200, content=b"<html>not json</html>"
+        )
 
-    async def test_incident_not_found(self, client):
+        with pytest.raises(MCPToolError) as exc_info:
+            await client.get_active_incidents()
+
+        assert exc_info.value.code == "SCHEMA_VALIDATION_ERROR"
+        assert "Invalid JSON" in str(exc_info.value.message)
+
+    async def test_incident_not_found(self, client, mocked_retry):
         """Test incident not found error handling."""
-        with patch.object(client, "_make_request_with_retry") as mock_request:
-            mock_request.side_effect = httpx.HTTPStatusError(
-                "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
-            )
+        mocked_retry.side_effect = httpx.HTTPStatusError(
+            "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
+        )
 
-            with pytest.raises(MCPToolError) as exc_info:
-                await client.get_incident("nonexistent")
+        with pytest.raises(MCPToolError) as exc_info:
+            await client.get_incident("nonexistent")
+
+        assert exc_info.value.code == "RESOURCE_NOT_FOUND"
+        assert "not found" in str(exc_info.value.message)
 
-            assert exc_info.value.code == "RESOURCE_NOT_FOUND"
-            assert "not found" in str(exc_info.value.message)
+    async def test_get_many_returns_per_item_results(self, client):
+        """Test that get_many fetches concurrently and isolates failures."""
+
+        async def fake_get_incident(incident_id):
+            if incident_id == "missing":
+                raise MCPToolError("RESOURCE_NOT_FOUND", "Incident missing not found")
+            return {"incident_id": incident_id}
+
+        with patch.object(client, "get_incident", side_effect=fake_get_incident):
+            results = await client.get_many(["F1", "missing", "F2"])
+
+        assert results[0] == {"incident_id": "F1"}
+        assert isinstance(results[1], MCPToolError)
+        assert results[1].code == "RESOURCE_NOT_FOUND"
+        assert results[2] == {"incident_id": "F2"}
+
+    async def test_get_many_propagates_unexpected_errors(self, client):
+        """Test that get_many doesn't swallow non-MCP exceptions."""
+        with patch.object(client, "get_incident", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                await client.get_many(["F1"])
 
     async def test_close_client(self, client):
         """Test client cleanup."""
@@ -361,54 +607,221 @@ class TestSeattleAPIClient:
         mock_client.aclose.assert_called_once()
         assert client._client is None
 
-    async def test_exponential_backoff_timing(self, client):
+    async def test_exponential_backoff_timing(self, client, upstream, sleep_log):
         """Test that exponential backoff timing is correct."""
-        sleep_times = []
+        upstream.reply(
+            httpx.TimeoutException("timeout"),
+            httpx.TimeoutException("timeout"),
+            httpx.TimeoutException("timeout"),
+        )
+
+        with patch(
+            "mcp_sfd.api_client.random.uniform", side_effect=lambda a, b: b
+        ) as mock_uniform:
+            with pytest.raises(MCPToolError):
+                await client._make_request_with_retry("/test")
+
+        # Jitter is drawn from [0, 1s] then [0, 2s]
+        assert [c.args for c in mock_uniform.call_args_list] == [(0, 1), (0, 2)]
+        assert sleep_log == [1, 2]
+
+    async def test_backoff_jitter_stays_within_cap(self, client, upstream, sleep_log):
+        """Test that jittered backoff never exceeds the exponential cap."""
+        upstream.reply(httpx.TimeoutException("timeout"))
+
+        with pytest.raises(MCPToolError):
+            await client._make_request_with_retry("/test")
+
+        assert len(sleep_log) == 2
+        assert 0 <= sleep_log[0] <= 1
+        assert 0 <= sleep_log[1] <= 2
+
+    async def test_concurrent_identical_requests_are_coalesced(
+        self, client, upstream, sample_incident_data
+    ):
+        """Test that concurrent identical GETs share a single upstream request."""
+        release = asyncio.Event()
+
+        async def slow_request(*args, **kwargs):
+            await release.wait()
+            return httpx.Response(200, json=sample_incident_data)
+
+        upstream.reply(slow_request)
+
+        calls = [asyncio.create_task(client.get_active_incidents()) for _ in range(5)]
+        other = asyncio.create_task(client.get_all_incidents())
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls, other)
+
+        assert all(result == sample_incident_data for result in results)
+        # One request for /incidents/active, one for /incidents/all
+        assert upstream.call_count == 2
+        assert client._inflight == {}
+
+    async def test_successful_responses_are_cached(
+        self, client, upstream, sample_incident_data
+    ):
+        """Test that repeated GETs within the TTL are served from cache."""
+        upstream.reply(httpx.Response(200, json=sample_incident_data))
+
+        first = await client.get_active_incidents()
+        second = await client.get_active_incidents()
+
+        assert first == second == sample_incident_data
+        assert first is not second  # Each caller gets its own decoded copy
+        assert upstream.call_count == 1
+
+    async def test_cache_disabled_with_zero_ttl(self, upstream, sample_incident_data):
+        """Test that a zero TTL disables response caching."""
+        client = SeattleAPIClient(
+            base_url="http://test-api:8000",
+            cache_ttl=0,
+            transport=httpx.MockTransport(upstream),
+        )
+
+        upstream.reply(httpx.Response(200, json=sample_incident_data))
+
+        await client.get_active_incidents()
+        await client.get_active_incidents()
+
+        assert upstream.call_count == 2
+        assert client._cache == {}
+
+        await client.close()
+
+    async def test_cache_is_bounded(self, upstream, sample_incident_data):
+        """Test that distinct requests can't grow the cache past its limit."""
+        client = SeattleAPIClient(
+            base_url="http://test-api:8000",
+            cache_max_entries=8,
+            transport=httpx.MockTransport(upstream),
+        )
+        upstream.reply(httpx.Response(200, json=sample_incident_data))
+
+        for i in range(100):
+            await client._make_request_with_retry(f"/incidents/{i}")
+
+        assert len(client._cache) == 8
+        # Oldest entries are evicted first
+        assert [key[0] for key in client._cache] == [
+            f"/incidents/{i}" for i in range(92, 100)
+        ]
+
+        await client.close()
+
+    async def test_expired_entries_are_swept(self, client, upstream):
+        """Test that expired entries are dropped even if never requested again."""
+        upstream.reply(httpx.Response(200, json=[]))
+
+        for i in range(10):
+            await client._make_request_with_retry(f"/incidents/{i}")
+        for entry in client._cache.values():
+            entry.expires_at = 0
+
+        await client._make_request_with_retry("/incidents/active")
+
+        assert list(client._cache) == [("/incidents/active", ())]
 
-        async def mock_sleep(duration):
-            sleep_times.append(duration)
+    async def test_near_expiry_entry_refreshed_in_background(
+        self, client, upstream, sample_incident_data
+    ):
+        """Test stale-while-revalidate for entries near the end of their TTL."""
+        refreshed_data = sample_incident_data[:1]
+
+        upstream.reply(
+            httpx.Response(200, json=sample_incident_data),
+            httpx.Response(200, json=refreshed_data),
+        )
+
+        await client.get_active_incidents()
+
+        # Move the entry into its refresh window
+        (entry,) = client._cache.values()
+        entry.stored_at -= client.cache_ttl * 0.9
+
+        # Stale data is served immediately while the refresh runs
+        assert await client.get_active_incidents() == sample_incident_data
+        assert len(client._refresh_tasks) == 1
+        await asyncio.gather(*client._refresh_tasks)
+
+        assert await client.get_active_incidents() == refreshed_data
+
+        assert upstream.call_count == 2
+        assert client._refresh_tasks == set()
+
+    async def test_per_call_cache_ttl(self, client, upstream, sample_incident_data):
+        """Test that a per-call TTL caps the age of the cached response served."""
+        refreshed_data = sample_incident_data[:1]
+
+        upstream.reply(
+            httpx.Response(200, json=sample_incident_data),
+            httpx.Response(200, json=refreshed_data),
+        )
+
+        await client.get_active_incidents()
+        (entry,) = client._cache.values()
+        entry.stored_at -= 5
+
+        # Still fresh under the client's TTL, too old for a 2 second TTL
+        assert await client.get_active_incidents() == sample_incident_data
+        assert await client.get_active_incidents(cache_ttl=2) == refreshed_data
+        assert await client.get_active_incidents(cache_ttl=2) == refreshed_data
 
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.request.side_effect = [
-                httpx.TimeoutException("timeout"),
-                httpx.TimeoutException("timeout"),
-                httpx.TimeoutException("timeout"),
-            ]
-            mock_get_client.return_value = mock_client
+        assert upstream.call_count == 2
+
+    async def test_zero_cache_ttl_always_fetches(
+        self, client, upstream, sample_incident_data
+    ):
+        """Test that a zero per-call TTL skips the cache without clearing it."""
+        upstream.reply(httpx.Response(200, json=sample_incident_data))
 
-            with patch("asyncio.sleep", side_effect=mock_sleep):
-                with pytest.raises(MCPToolError):
-                    await client._make_request_with_retry("GET", "/test")
+        await client.get_active_incidents()
+        await client.get_active_incidents(cache_ttl=0)
+        await client.get_active_incidents()
 
-            # Should have exponential backoff: 1s, 2s
-            assert sleep_times == [1, 2]
+        assert upstream.call_count == 2
+        assert list(client._cache) == [("/incidents/active", ())]
 
 
 class TestGlobalClientFunctions:
     """Test cases for global client management functions."""
 
+    @pytest.fixture(autouse=True)
+    async def fresh_global_client(self, monkeypatch):
+        """Start and finish each test without a global client."""
+        monkeypatch.setenv("FASTAPI_BASE_URL", "http://test:8000")
+        await close_client()
+        yield
+        await close_client()
+
     async def test_get_client_singleton(self):
         """Test that get_client returns singleton instance."""
-        # Clean up any existing client
-        await close_client()
+        client1 = await get_client()
+        client2 = await get_client()
 
-        with patch.dict(
-            "os.environ",
-            {
-                "FASTAPI_BASE_URL": "http://test:8000",
-                "REQUEST_TIMEOUT": "30",
-                "MAX_RETRIES": "3",
-            },
-        ):
-            client1 = await get_client()
-            client2 = await get_client()
-
-            assert client1 is client2
-            assert client1.base_url == "http://test:8000"
-
-        # Clean up
-        await close_client()
+        assert client1 is client2
+        assert client1.base_url == "http://test:8000"
+
+    async def test_get_client_concurrent_callers_share_instance(self):
+        """Test that concurrent first calls create a single client."""
+        clients = await asyncio.gather(*(get_client() for _ in range(10)))
+
+        assert all(c is clients[0] for c in clients)
+
+    async def test_close_client_detaches_before_closing(self):
+        """Test that callers never receive a client that is being closed."""
+        client = await get_client()
+        seen_during_close = []
+
+        async def slow_close():
+            await asyncio.sleep(0)
+            seen_during_close.append(await get_client())
+
+        with patch.object(client, "close", side_effect=slow_close):
+            await close_client()
+
+        assert seen_during_close[0] is not client
 
     async def test_close_client_cleanup(self):
         """Test that close_client properly cleans up global instance."""
@@ -425,91 +838,55 @@ class TestGlobalClientFunctions:
         new_client = await get_client()
         assert new_client is not client
 
-        # Clean up
-        await close_client()
-
 
-@pytest.mark.asyncio
 class TestIntegrationScenarios:
     """Integration test scenarios combining multiple client operations."""
 
     @pytest.fixture
-    def client(self):
+    async def client(self, upstream):
         """Create a test client for integration tests."""
-        return SeattleAPIClient(base_url="http://test-api:8000", max_retries=1)
-
-    @pytest.fixture
-    def sample_incident_data(self):
-        """Sample incident data for testing."""
-        return [
-            {
-                "incident_id": "F240001234",
-                "incident_datetime": "2024-01-01T10:30:00Z",
-                "priority": 3,
-                "units": ["E17", "L9"],
-                "address": "123 Test St",
-                "incident_type": "Aid Response",
-                "status": "active",
-                "first_seen": "2024-01-01T10:30:00Z",
-                "last_seen": "2024-01-01T10:35:00Z",
-                "closed_at": None,
-            }
-        ]
+        client = SeattleAPIClient(
+            base_url="http://test-api:8000",
+            max_retries=1,
+            transport=httpx.MockTransport(upstream),
+        )
+        yield client
+        await client.close()
 
-    @pytest.fixture
-    def sample_health_data(self):
-        """Sample health status data for testing."""
-        return {
-            "status": "healthy",
-            "service": "seattle-fire-api",
-            "version": "1.0.0",
-            "config": {"polling_interval": 300, "cache_enabled": True},
-        }
-
-    async def test_service_recovery_scenario(self, client, sample_incident_data):
+    async def test_service_recovery_scenario(
+        self, client, upstream, sample_incident_data
+    ):
         """Test client behavior during service recovery."""
         # Simulate service down then up
         responses = [
-            MagicMock(status_code=503, text="Service Unavailable"),
-            MagicMock(status_code=200, json=lambda: sample_incident_data),
+            httpx.Response(503, text="Service Unavailable"),
+            httpx.Response(200, json=sample_incident_data),
         ]
 
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.request.side_effect = responses
-            mock_get_client.return_value = mock_client
+        upstream.reply(*responses)
 
-            with patch("asyncio.sleep"):
-                result = await client.get_active_incidents()
+        result = await client.get_active_incidents()
 
-            assert result == sample_incident_data
-            assert mock_client.request.call_count == 2
+        assert result == sample_incident_data
+        assert upstream.call_count == 2
 
     async def test_mixed_operation_sequence(
-        self, client, sample_incident_data, sample_health_data
+        self, client, mocked_retry, sample_incident_data, sample_health_data
     ):
         """Test a sequence of different operations."""
+        mocked_retry.side_effect = [
+            httpx.Response(200, json=sample_health_data),
+            httpx.Response(200, json=sample_incident_data),
+            httpx.Response(200, json=sample_incident_data[0]),
+        ]
+
+        # Sequence of operations
+        health = await client.get_health()
+        incidents = await client.get_active_incidents()
+        specific = await client.get_incident("F240001234")
+
+        assert health == sample_health_data
+        assert incidents == sample_incident_data
+        assert specific == sample_incident_data[0]
 
-        def create_mock_response(data):
-            mock = MagicMock()
-            mock.status_code = 200
-            mock.json.return_value = data
-            return mock
-
-        with patch.object(client, "_make_request_with_retry") as mock_request:
-            mock_request.side_effect = [
-                create_mock_response(sample_health_data),
-                create_mock_response(sample_incident_data),
-                create_mock_response(sample_incident_data[0]),
-            ]
-
-            # Sequence of operations
-            health = await client.get_health()
-            incidents = await client.get_active_incidents()
-            specific = await client.get_incident("F240001234")
-
-            assert health == sample_health_data
-            assert incidents == sample_incident_data
-            assert specific == sample_incident_data[0]
-
-            assert mock_request.call_count == 3
+        assert mocked_retry.call_count == 3
@@ -5,7 +5,8 @@ Tests cover successful responses, error handling, data formatting,
 and integration with the FastAPI client.
 """
 
-from unittest.mock import AsyncMock, patch
+import re
+from types import MappingProxyType
 
 import pytest
 from mcp.types import TextContent
@@ -17,54 +18,104 @@ from mcp_sfd.tools.get_active_incidents import (
     get_active_incidents,
 )
 
+# Read-only incidents in the FastAPI service format, shared by every test
+SAMPLE_INCIDENTS = (
+    MappingProxyType(
+        {
+            "incident_id": "F240001234",
+            "incident_datetime": "2024-01-01T10:30:00Z",
+            "priority": 3,
+            "units": ["E17", "L9"],
+            "address": "123 Test St",
+            "incident_type": "Aid Response",
+            "status": "active",
+            "first_seen": "2024-01-01T10:30:00Z",
+            "last_seen": "2024-01-01T10:35:00Z",
+            "closed_at": None,
+        }
+    ),
+    MappingProxyType(
+        {
+            "incident_id": "F240001235",
+            "incident_datetime": "2024-01-01T11:00:00Z",
+            "priority": 1,
+            "units": ["E12", "E15", "L3"],
+            "address": "456 Emergency Ave",
+            "incident_type": "Structure Fire",
+            "status": "active",
+            "first_seen": "2024-01-01T11:00:00Z",
+            "last_seen": "2024-01-01T11:05:00Z",
+            "closed_at": None,
+        }
+    ),
+)
+
+# Full rendering of the two sample incidents; compiled once at import
+EXPECTED_SUCCESS_RESPONSE = re.compile(
+    r"Active Seattle Fire Department Incidents \(2 incidents found\)\n"
+    r"=+\n"
+    r"F240001234 \| 10:30 AM \| Aid Response \| 123 Test St"
+    r" \| Units: E17, L9 \| Priority: 3 \| Status: active\n"
+    r"F240001235 \| 11:00 AM \| Structure Fire \| 456 Emergency Ave"
+    r" \| Units: E12, E15, L3 \| Priority: 1 \| Status: active\n"
+    r"Last updated: \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} UTC"
+)
+
+
+def _text(result):
+    """Return the text of the single TextContent a tool call produced."""
+    [content] = result
+    return content.text
+
+
+class FakeAPIClient:
+    """Stand-in for SeattleAPIClient that returns or raises a canned outcome."""
+
+    def __init__(self):
+        self.result = []
+        self.error = None
+        self.calls = 0
+        self.cache_ttl = None
+
+    async def get_active_incidents(self, cache_ttl=None):
+        self.calls += 1
+        self.cache_ttl = cache_ttl
+        if self.error is not None:
+            raise self.error
+        return self.result
+
 
 class TestGetActiveIncidents:
     """Test cases for get_active_incidents tool."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_incident_data(self):
         """Sample incident data matching FastAPI service format."""
-        return [
-            {
-                "incident_id": "F240001234",
-                "incident_datetime": "2024-01-01T10:30:00Z",
-                "priority": 3,
-                "units": ["E17", "L9"],
-                "address": "123 Test St",
-                "incident_type": "Aid Response",
-                "status": "active",
-                "first_seen": "2024-01-01T10:30:00Z",
-                "last_seen": "2024-01-01T10:35:00Z",
-                "closed_at": None,
-            },
-            {
-                "incident_id": "F240001235",
-                "incident_datetime": "2024-01-01T11:00:00Z",
-                "priority": 1,
-                "units": ["E12", "E15", "L3"],
-                "address": "456 Emergency Ave",
-                "incident_type": "Structure Fire",
-                "status": "active",
-                "first_seen": "2024-01-01T11:00:00Z",
-                "last_seen": "2024-01-01T11:05:00Z",
-                "closed_at": None,
-            },
-        ]
+        return SAMPLE_INCIDENTS
 
     @pytest.fixture
-    def mock_api_client(self):
-        """Create a mock API client."""
-        mock_client = AsyncMock()
-        return mock_client
+    def fake_client(self):
+        """Fresh fake API client per test."""
+        return FakeAPIClient()
+
+    @pytest.fixture(autouse=True)
+    def patched_client(self, monkeypatch, fake_client):
+        """Route the tool's get_client() to the fake API client."""
+
+        async def fake_get_client():
+            return fake_client
+
+        monkeypatch.setattr(
+            "mcp_sfd.tools.get_active_incidents.get_client", fake_get_client
+        )
+        return fake_client
 
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
     async def test_successful_get_active_incidents(
-        self, mock_get_client, mock_api_client, sample_incident_data
+        self, fake_client, sample_incident_data
     ):
         """Test successful retrieval and formatting of active incidents."""
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.return_value = sample_incident_data
+        # Setup fake client
+        fake_client.result = sample_incident_data
 
         # Call the tool
         result = await get_active_incidents({})
@@ -75,192 +126,124 @@ class TestGetActiveIncidents:
         assert isinstance(result[0], TextContent)
         assert result[0].type == "text"
 
-        response_text = result[0].text
-
-        # Check header
-        assert (
-            "Active Seattle Fire Department Incidents (2 incidents found)"
-            in response_text
-        )
-
-        # Check incident data is formatted properly
-        assert "F240001234" in response_text
-        assert "F240001235" in response_text
-        assert "10:30 AM" in response_text
-        assert "11:00 AM" in response_text
-        assert "Aid Response" in response_text
-        assert "Structure Fire" in response_text
-        assert "123 Test St" in response_text
-        assert "456 Emergency Ave" in response_text
-        assert "Units: E17, L9" in response_text
-        assert "Units: E12, E15, L3" in response_text
-        assert "Priority: 3" in response_text
-        assert "Priority: 1" in response_text
-
-        # Check footer
-        assert "Last updated:" in response_text
-        assert "UTC" in response_text
+        # Header, both incident lines and footer in a single match
+        assert EXPECTED_SUCCESS_RESPONSE.fullmatch(result[0].text)
 
         # Verify API client was called correctly
-        mock_get_client.assert_called_once()
-        mock_api_client.get_active_incidents.assert_called_once()
+        assert fake_client.calls == 1
 
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
-    async def test_no_active_incidents(self, mock_get_client, mock_api_client):
+    async def test_no_active_incidents(self, fake_client):
         """Test handling of empty incident list."""
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.return_value = []
+        # Setup fake client
+        fake_client.result = []
 
         # Call the tool
-        result = await get_active_incidents({})
+        response_text = _text(await get_active_incidents({}))
 
         # Verify result
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
-
-        response_text = result[0].text
         assert "No active Seattle Fire Department incidents found" in response_text
         assert "Last updated:" in response_text
         assert "UTC" in response_text
 
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
-    async def test_custom_cache_ttl(self, mock_get_client, mock_api_client):
+    async def test_custom_cache_ttl(self, fake_client):
         """Test tool with custom cache TTL parameter."""
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.return_value = []
+        # Setup fake client
+        fake_client.result = []
 
         # Call the tool with custom cache TTL
         arguments = {"cache_ttl_seconds": 60}
-        result = await get_active_incidents(arguments)
-
-        # Verify result format is correct
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
-
-        # Note: The current implementation doesn't pass cache_ttl to the API client
-        # This test verifies the parameter is accepted without error
-        mock_api_client.get_active_incidents.assert_called_once()
-
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
-    async def test_service_unavailable_error(self, mock_get_client, mock_api_client):
-        """Test handling of service unavailable error."""
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.side_effect = MCPToolError(
-            "SERVICE_UNAVAILABLE", "Cannot connect to FastAPI service"
-        )
-
-        # Call the tool
-        result = await get_active_incidents({})
-
-        # Verify error handling
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
-
-        response_text = result[0].text
-        assert (
-            "❌ Cannot connect to the Seattle Fire Department data service"
-            in response_text
-        )
-        assert "FastAPI service is not running" in response_text
-        assert "Network connectivity issues" in response_text
-
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
-    async def test_timeout_error(self, mock_get_client, mock_api_client):
-        """Test handling of timeout error."""
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.side_effect = MCPToolError(
-            "UPSTREAM_TIMEOUT", "Request timed out after 3 retries"
-        )
-
-        # Call the tool
-        result = await get_active_incidents({})
-
-        # Verify error handling
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
+        response_text = _text(await get_active_incidents(arguments))
+        assert "No active Seattle Fire Department incidents found" in response_text
 
-        response_text = result[0].text
-        assert (
-            "⏱️ Request to Seattle Fire Department data service timed out"
-            in response_text
-        )
-        assert "high load or temporary issues" in response_text
-
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
-    async def test_schema_validation_error(self, mock_get_client, mock_api_client):
-        """Test handling of schema validation error."""
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.side_effect = MCPToolError(
-            "SCHEMA_VALIDATION_ERROR", "Invalid response format"
-        )
+        # The TTL is passed through to the API client's cache
+        assert fake_client.calls == 1
+        assert fake_client.cache_ttl == 60
 
-        # Call the tool
-        result = await get_active_incidents({})
+    @pytest.mark.parametrize(
+        "cache_ttl_seconds, expected", [("60", 60), (12.5, 12), (-5, 0), (3600, 300)]
+    )
+    async def test_cache_ttl_is_coerced_and_clamped(
+        self, fake_client, cache_ttl_seconds, expected
+    ):
+        """Test that loosely typed or out-of-range TTLs are normalized."""
+        await get_active_incidents({"cache_ttl_seconds": cache_ttl_seconds})
 
-        # Verify error handling
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
+        assert fake_client.cache_ttl == expected
 
-        response_text = result[0].text
-        assert "📋 Received invalid data format from the service" in response_text
-        assert "potential issue with the data service" in response_text
-
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
-    async def test_unknown_mcp_error(self, mock_get_client, mock_api_client):
-        """Test handling of unknown MCP error codes."""
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.side_effect = MCPToolError(
-            "UNKNOWN_ERROR", "Some unknown error occurred"
+    @pytest.mark.parametrize("cache_ttl_seconds", ["soon", [60]])
+    async def test_invalid_cache_ttl_is_rejected(self, fake_client, cache_ttl_seconds):
+        """Test that a non-integer TTL is reported as an invalid argument."""
+        response_text = _text(
+            await get_active_incidents({"cache_ttl_seconds": cache_ttl_seconds})
         )
 
-        # Call the tool
-        result = await get_active_incidents({})
-
-        # Verify error handling
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
-
-        response_text = result[0].text
-        assert (
-            "🚨 Unexpected error from Seattle Fire Department service" in response_text
-        )
-        assert "Some unknown error occurred" in response_text
-
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
-    async def test_unexpected_exception(self, mock_get_client, mock_api_client):
-        """Test handling of unexpected exceptions."""
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.side_effect = ValueError(
-            "Unexpected error"
-        )
+        assert response_text.startswith("⚠️ Invalid tool arguments:")
+        assert "cache_ttl_seconds must be an integer" in response_text
+        assert fake_client.calls == 0
+
+    @pytest.mark.parametrize(
+        "error, expected_phrases",
+        [
+            (
+                MCPToolError(
+                    "SERVICE_UNAVAILABLE", "Cannot connect to FastAPI service"
+                ),
+                [
+                    "❌ Cannot connect to the Seattle Fire Department data service",
+                    "FastAPI service is not running",
+                    "Network connectivity issues",
+                ],
+            ),
+            (
+                MCPToolError("UPSTREAM_TIMEOUT", "Request timed out after 3 retries"),
+                [
+                    "⏱️ Request to Seattle Fire Department data service timed out",
+                    "high load or temporary issues",
+                ],
+            ),
+            (
+                MCPToolError("SCHEMA_VALIDATION_ERROR", "Invalid response format"),
+                [
+                    "📋 Received invalid data format from the service",
+                    "potential issue with the data service",
+                ],
+            ),
+            (
+                MCPToolError("UNKNOWN_ERROR", "Some unknown error occurred"),
+                [
+                    "🚨 Unexpected error from Seattle Fire Department service",
+                    "Some unknown error occurred",
+                ],
+            ),
+            (
+                ValueError("Unexpected error"),
+                [
+                    "💥 An unexpected error occurred: Unexpected error",
+                    "likely a bug in the tool implementation",
+                ],
+            ),
+        ],
+        ids=[
+            "service-unavailable",
+            "timeout",
+            "schema-validation",
+            "unknown-mcp-error",
+            "unexpected-exception",
+        ],
+    )
+    async def test_error_handling(self, fake_client, error, expected_phrases):
+        """Test that client errors are turned into user-friendly messages."""
+        # Setup fake client
+        fake_client.error = error
 
         # Call the tool
-        result = await get_active_incidents({})
+        response_text = _text(await get_active_incidents({}))
 
         # Verify error handling
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
+        for phrase in expected_phrases:
+            assert phrase in response_text
 
-        response_text = result[0].text
-        assert "💥 An unexpected error occurred: Unexpected error" in response_text
-        assert "likely a bug in the tool implementation" in response_text
-
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
-    async def test_incident_with_missing_fields(self, mock_get_client, mock_api_client):
+    async def test_incident_with_missing_fields(self, fake_client):
         """Test handling of incidents with missing or None fields."""
         # Incident data with missing fields
         incomplete_incident = {
@@ -273,27 +256,20 @@ class TestGetActiveIncidents:
             # Missing status
         }
 
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.return_value = [incomplete_incident]
+        # Setup fake client
+        fake_client.result = [incomplete_incident]
 
         # Call the tool
-        result = await get_active_incidents({})
+        response_text = _text(await get_active_incidents({}))
 
         # Verify result handles missing fields gracefully
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
-
-        response_text = result[0].text
         assert "F240999999" in response_text
         assert "Unknown Time" in response_text
         assert "Unknown Type" in response_text
         # Should handle empty/None address
         assert "Unknown Address" in response_text or "" in response_text
 
-    @patch("mcp_sfd.tools.get_active_incidents.get_client")
-    async def test_incident_with_string_units(self, mock_get_client, mock_api_client):
+    async def test_incident_with_string_units(self, fake_client):
         """Test handling of incidents where units is a string instead of list."""
         # Incident data with string units
         incident_with_string_units = {
@@ -306,19 +282,13 @@ class TestGetActiveIncidents:
             "status": "active",
         }
 
-        # Setup mocks
-        mock_get_client.return_value = mock_api_client
-        mock_api_client.get_active_incidents.return_value = [incident_with_string_units]
+        # Setup fake client
+        fake_client.result = [incident_with_string_units]
 
         # Call the tool
-        result = await get_active_incidents({})
+        response_text = _text(await get_active_incidents({}))
 
         # Verify result handles string units correctly
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], TextContent)
-
-        response_text = result[0].text
         assert "F240777777" in response_text
         assert "Units: E20" in response_text
 
@@ -326,70 +296,52 @@ class TestGetActiveIncidents:
 class TestUtilityFunctions:
     """Test cases for utility functions."""
 
-    def test_format_incident_time_iso_format(self):
-        """Test formatting of ISO format datetime."""
-        iso_time = "2024-01-01T14:30:00Z"
-        result = _format_incident_time(iso_time)
-        assert result == "02:30 PM"
-
-    def test_format_incident_time_iso_with_timezone(self):
-        """Test formatting of ISO format datetime with timezone."""
-        iso_time = "2024-01-01T14:30:00+00:00"
-        result = _format_incident_time(iso_time)
-        assert result == "02:30 PM"
-
-    def test_format_incident_time_none(self):
-        """Test formatting of None datetime."""
-        result = _format_incident_time(None)
-        assert result == "Unknown Time"
-
-    def test_format_incident_time_empty_string(self):
-        """Test formatting of empty string datetime."""
-        result = _format_incident_time("")
-        assert result == "Unknown Time"
-
-    def test_format_incident_time_invalid_format(self):
-        """Test formatting of invalid datetime format."""
-        invalid_time = "not a datetime"
-        result = _format_incident_time(invalid_time)
-        assert result == "not a datetime"
-
-    def test_format_incident_time_non_iso_format(self):
-        """Test formatting of non-ISO datetime format."""
-        non_iso_time = "2024-01-01 14:30:00"
-        result = _format_incident_time(non_iso_time)
-        assert result == "2024-01-01 14:30:00"
-
-    def test_format_units_list(self):
-        """Test formatting of units list."""
-        units_list = ["E17", "L9", "M1"]
-        result = _format_units(units_list)
-        assert result == "E17, L9, M1"
-
-    def test_format_units_empty_list(self):
-        """Test formatting of empty units list."""
-        result = _format_units([])
-        assert result == ""
-
-    def test_format_units_none(self):
-        """Test formatting of None units."""
-        result = _format_units(None)
-        assert result == ""
-
-    def test_format_units_string(self):
-        """Test formatting of units as string."""
-        units_string = "E20"
-        result = _format_units(units_string)
-        assert result == "E20"
-
-    def test_format_units_list_with_empty_strings(self):
-        """Test formatting of units list with empty strings."""
-        units_list = ["E17", "", "L9", None, "M1"]
-        result = _format_units(units_list)
-        assert result == "E17, L9, M1"
-
-    def test_format_units_non_string_non_list(self):
-        """Test formatting of units that is neither string nor list."""
-        units_number = 123
-        result = _format_units(units_number)
-        assert result == "123"
+    @pytest.mark.parametrize(
+        "incident_datetime, expected",
+        [
+            ("2024-01-01T14:30:00Z", "02:30 PM"),
+            ("2024-01-01T14:30:00+00:00", "02:30 PM"),
+            (None, "Unknown Time"),
+            ("", "Unknown Time"),
+            ("not a datetime", "not a datetime"),
+            ("2024-01-01 14:30:00", "2024-01-01 14:30:00"),
+            (["2024-01-01T14:30:00Z"], "Unknown Time"),
+            ({"time": "14:30"}, "Unknown Time"),
+        ],
+        ids=[
+            "iso-format",
+            "iso-with-timezone",
+            "none",
+            "empty-string",
+            "invalid-format",
+            "non-iso-format",
+            "list",
+            "dict",
+        ],
+    )
+    def test_format_incident_time(self, incident_datetime, expected):
+        """Test formatting of incident datetimes for display."""
+        assert _format_incident_time(incident_datetime) == expected
+
+    @pytest.mark.parametrize(
+        "units, expected",
+        [
+            (["E17", "L9", "M1"], "E17, L9, M1"),
+            ([], ""),
+            (None, ""),
+            ("E20", "E20"),
+            (["E17", "", "L9", None, "M1"], "E17, L9, M1"),
+            (123, "123"),
+        ],
+        ids=[
+            "list",
+            "empty-list",
+            "none",
+            "string",
+            "list-with-empty-strings",
+            "non-string-non-list",
+        ],
+    )
+    def test_format_units(self, units, expected):
+        """Test formatting of unit lists for display."""
+        assert _format_units(units) == expected
@@ -7,6 +7,7 @@ and formats them for LLM consumption with clear incident details.
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from mcp.types import TextContent
@@ -15,6 +16,9 @@ from ..api_client import MCPToolError, get_client
 
 logger = logging.getLogger(__name__)
 
+# Bounds of the cache_ttl_seconds input schema; the MCP server doesn't enforce them
+_MAX_CACHE_TTL = 300
+
 
 async def get_active_incidents(arguments: dict[str, Any]) -> list[TextContent]:
     """
@@ -25,7 +29,8 @@ async def get_active_incidents(arguments: dict[str, Any]) -> list[TextContent]:
 
     Args:
         arguments: Tool arguments containing:
-            - cache_ttl_seconds (optional): Cache TTL override (default: 15)
+            - cache_ttl_seconds (optional): Maximum age of a cached response
+              to serve, in seconds (default: the client's DEFAULT_CACHE_TTL)
 
     Returns:
         List containing a single TextContent with formatted incident data
@@ -33,19 +38,22 @@ async def get_active_incidents(arguments: dict[str, Any]) -> list[TextContent]:
     Raises:
         MCPToolError: When the FastAPI service is unavailable or returns invalid data
     """
-    cache_ttl = arguments.get("cache_ttl_seconds", 15)
+    cache_ttl = arguments.get("cache_ttl_seconds")
 
-    logger.info(
-        "Fetching active incidents",
-        extra={"cache_ttl": cache_ttl, "tool": "get_active_incidents"},
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Fetching active incidents",
+            extra={"cache_ttl": cache_ttl, "tool": "get_active_incidents"},
+        )
 
     try:
         # Get the API client
         client = await get_client()
 
         # Fetch active incidents from FastAPI service
-        incidents = await client.get_active_incidents()
+        incidents = await client.get_active_incidents(
+            cache_ttl=_parse_cache_ttl(cache_ttl)
+        )
 
         # Format response for LLM consumption
         if not incidents:
@@ -89,12 +97,16 @@ async def get_active_incidents(arguments: dict[str, Any]) -> list[TextContent]:
 
             response_text = header + separator + incidents_text + footer
 
-        logger.info(
-            "Successfully fetched active incidents",
-            extra={"incident_count": len(incidents), "tool": "get_active_incidents"},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Successfully fetched active incidents",
+                extra={
+                    "incident_count": len(incidents),
+                    "tool": "get_active_incidents",
+                },
+            )
 
-        return [TextContent(type="text", text=response_text)]
+        return [TextContent.model_construct(type="text", text=response_text)]
 
     except MCPToolError as e:
         # Re-raise MCP tool errors with context
@@ -123,6 +135,8 @@ async def get_active_incidents(arguments: dict[str, Any]) -> list[TextContent]:
                 "The service may be experiencing high load or temporary issues. "
                 "Please try again in a few moments."
             )
+        elif e.code == "INVALID_ARGUMENT":
+            error_text = f"⚠️ Invalid tool arguments: {e.message}"
         elif e.code == "SCHEMA_VALIDATION_ERROR":
             error_text = (
                 "📋 Received invalid data format from the service.\n\n"
@@ -135,7 +149,7 @@ async def get_active_incidents(arguments: dict[str, Any]) -> list[TextContent]:
                 "Please check the service status and try again."
             )
 
-        return [TextContent(type="text", text=error_text)]
+        return [TextContent.model_construct(type="text", text=error_text)]
 
     except Exception as e:
         # Handle unexpected errors
@@ -155,14 +169,36 @@ async def get_active_incidents(arguments: dict[str, Any]) -> list[TextContent]:
             "Please check the logs for more details."
         )
 
-        return [TextContent(type="text", text=error_text)]
+        return [TextContent.model_construct(type="text", text=error_text)]
+
+
+def _parse_cache_ttl(cache_ttl: Any) -> int | None:
+    """Coerce cache_ttl_seconds to an int clamped to the schema's 0-300 range."""
+    if cache_ttl is None:
+        return None
+    try:
+        value = int(cache_ttl)
+    except (TypeError, ValueError) as e:
+        raise MCPToolError(
+            "INVALID_ARGUMENT",
+            f"cache_ttl_seconds must be an integer, got {cache_ttl!r}",
+        ) from e
+    return min(max(value, 0), _MAX_CACHE_TTL)
 
 
 def _format_incident_time(incident_datetime: str | None) -> str:
     """Format incident datetime for display."""
     if not incident_datetime:
         return "Unknown Time"
+    if not isinstance(incident_datetime, str):
+        # Malformed upstream value (e.g. a list); don't fail the whole reply
+        return "Unknown Time"
+    return _format_iso_time(incident_datetime)
+
 
+@lru_cache(maxsize=1024)
+def _format_iso_time(incident_datetime: str) -> str:
+    """Format a datetime string, memoized across repeated polls."""
     try:
         # Try to parse ISO format datetime
         if "T" in incident_datetime:
@@ -171,8 +207,8 @@ def _format_incident_time(incident_datetime: str | None) -> str:
         else:
             # Fallback for other formats
             return incident_datetime
-    except (ValueError, AttributeError):
-        return incident_datetime or "Unknown Time"
+    except ValueError:
+        return incident_datetime
 
 
 def _format_units(units: list[str] | None) -> str:
@@ -1,10 +1,11 @@
 """In-memory incident cache with thread-safe operations."""
 
 import asyncio
+import heapq
 import logging
 import threading
 from collections.abc import Callable
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 from .models import Incident, IncidentSearchFilters, IncidentStatus
 
@@ -39,6 +40,10 @@ class IncidentCache:
             memory_warning_threshold: Memory usage threshold for warnings (0.0-1.0)
         """
         self._incidents: dict[str, Incident] = {}
+        # Min-heap of (closed_at timestamp, incident_id) so cleanup only visits
+        # incidents that are actually past retention. Entries are validated
+        # lazily on pop, so stale entries (reopened/re-closed) are harmless.
+        self._closed_index: list[tuple[float, str]] = []
         self._retention_hours = retention_hours
         self._cleanup_interval_minutes = cleanup_interval_minutes
         self._max_cache_size = max_cache_size
@@ -81,6 +86,22 @@ class IncidentCache:
                 logger.debug(f"Added new incident {incident.incident_id}")
 
             self._incidents[incident.incident_id] = incident
+            self._index_closed(incident)
+
+    @staticmethod
+    def _closed_timestamp(closed_at: datetime) -> float:
+        """Convert a closed_at datetime to a UTC timestamp (naive values are UTC)."""
+        if closed_at.tzinfo is None:
+            closed_at = closed_at.replace(tzinfo=UTC)
+        return closed_at.timestamp()
+
+    def _index_closed(self, incident: Incident) -> None:
+        """Track a closed incident in the expiry index."""
+        if incident.status == IncidentStatus.CLOSED and incident.closed_at:
+            heapq.heappush(
+                self._closed_index,
+                (self._closed_timestamp(incident.closed_at), incident.incident_id),
+            )
 
     def get_incident(self, incident_id: str) -> Incident | None:
         """Get a specific incident by ID.
@@ -101,12 +122,15 @@ class IncidentCache:
             List of active incidents sorted by incident_datetime (newest first)
         """
         with self._lock:
-            active = [
-                incident
-                for incident in self._incidents.values()
-                if incident.status == IncidentStatus.ACTIVE
-            ]
-            return sorted(active, key=lambda x: x.incident_datetime, reverse=True)
+            return sorted(
+                (
+                    incident
+                    for incident in self._incidents.values()
+                    if incident.status == IncidentStatus.ACTIVE
+                ),
+                key=lambda x: x.incident_datetime,
+                reverse=True,
+            )
 
     def get_all_incidents(self) -> list[Incident]:
         """Get all incidents in the cache (active and closed within retention period).
@@ -179,6 +203,7 @@ class IncidentCache:
             if incident and incident.status == IncidentStatus.ACTIVE:
                 incident.status = IncidentStatus.CLOSED
                 incident.closed_at = datetime.utcnow()
+                self._index_closed(incident)
                 logger.debug(f"Marked incident {incident_id} as closed")
                 return True
             return False
@@ -198,6 +223,7 @@ class IncidentCache:
                         # Incident is no longer active, mark as closed
                         incident.status = IncidentStatus.CLOSED
                         incident.closed_at = datetime.utcnow()
+                        self._index_closed(incident)
                         logger.debug(f"Auto-closed incident {incident_id}")
                     else:
                         # Update last_seen timestamp for active incidents
@@ -393,20 +419,22 @@ class IncidentCache:
         """
         with self._lock:
             cutoff_time = datetime.utcnow() - timedelta(hours=self._retention_hours)
+            cutoff_ts = self._closed_timestamp(cutoff_time)
             expired_ids: list[str] = []
             before_count = len(self._incidents)
 
-            for incident_id, incident in self._incidents.items():
+            while self._closed_index and self._closed_index[0][0] < cutoff_ts:
+                closed_ts, incident_id = heapq.heappop(self._closed_index)
+                incident = self._incidents.get(incident_id)
                 if (
-                    incident.status == IncidentStatus.CLOSED
+                    incident is not None
+                    and incident.status == IncidentStatus.CLOSED
                     and incident.closed_at
-                    and incident.closed_at < cutoff_time
+                    and self._closed_timestamp(incident.closed_at) == closed_ts
                 ):
+                    del self._incidents[incident_id]
                     expired_ids.append(incident_id)
-
-            for incident_id in expired_ids:
-                del self._incidents[incident_id]
-                logger.debug(f"Removed expired incident {incident_id}")
+                    logger.debug(f"Removed expired incident {incident_id}")
 
             removed_count = len(expired_ids)
             self._total_removed += removed_count
@@ -494,6 +522,7 @@ class IncidentCache:
         with self._lock:
             incident_count = len(self._incidents)
             self._incidents.clear()
+            self._closed_index.clear()
             # Reset statistics
             self._total_cleanups = 0
             self._total_removed = 0
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 from enum import Enum
@@ -62,7 +63,8 @@ class CircuitBreaker:
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._last_failure_time: datetime | None = None
-        self._next_attempt_time: datetime | None = None
+        self._next_attempt_time: datetime | None = None  # For reporting only
+        self._next_attempt_deadline: float | None = None  # time.monotonic() based
 
         # Statistics
         self._total_requests = 0
@@ -151,7 +153,10 @@ class CircuitBreaker:
 
         if self._state == CircuitState.OPEN:
             # Check if enough time has passed to try recovery
-            if self._next_attempt_time and datetime.now(UTC) >= self._next_attempt_time:
+            if (
+                self._next_attempt_deadline is not None
+                and time.monotonic() >= self._next_attempt_deadline
+            ):
                 logger.info(
                     f"Circuit breaker '{self.name}' transitioning to half-open for recovery test"
                 )
@@ -214,6 +219,7 @@ class CircuitBreaker:
     def _open_circuit(self) -> None:
         """Open the circuit (block all requests)."""
         self._state = CircuitState.OPEN
+        self._next_attempt_deadline = time.monotonic() + self.recovery_timeout
         self._next_attempt_time = datetime.now(UTC) + timedelta(
             seconds=self.recovery_timeout
         )
@@ -228,6 +234,7 @@ class CircuitBreaker:
         self._failure_count = 0
         self._last_failure_time = None
         self._next_attempt_time = None
+        self._next_attempt_deadline = None
 
     async def reset(self) -> None:
         """Manually reset the circuit breaker."""
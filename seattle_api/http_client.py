@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 from datetime import datetime
 from typing import Any
 
@@ -86,7 +87,9 @@ class SeattleHTTPClient:
         for attempt in range(self.max_retries + 1):
             try:
                 logger.debug(
-                    f"Fetching incidents (attempt {attempt + 1}/{self.max_retries + 1})"
+                    "Fetching incidents (attempt %d/%d)",
+                    attempt + 1,
+                    self.max_retries + 1,
                 )
 
                 response = await self._client.get(self.endpoint_url)
@@ -103,31 +106,36 @@ class SeattleHTTPClient:
                     raise HTTPClientError("Response does not appear to be valid HTML")
 
                 logger.info(
-                    f"Successfully fetched incident data ({len(html_content)} characters)"
+                    "Successfully fetched incident data (%d characters)",
+                    len(html_content),
                 )
                 return html_content
 
             except (HTTPError, TimeoutException, ConnectError) as e:
                 last_exception = e
-                logger.warning(f"HTTP request failed (attempt {attempt + 1}): {e}")
+                logger.warning("HTTP request failed (attempt %d): %s", attempt + 1, e)
 
                 # Don't retry on client errors (4xx)
                 if (
                     isinstance(e, httpx.HTTPStatusError)
                     and 400 <= e.response.status_code < 500
                 ):
-                    logger.error(f"Client error {e.response.status_code}, not retrying")
+                    logger.error(
+                        "Client error %d, not retrying", e.response.status_code
+                    )
                     break
 
-                # Calculate delay for exponential backoff
+                # Calculate delay for exponential backoff with full jitter
                 if attempt < self.max_retries:
-                    delay = min(self.base_delay * (2**attempt), self.max_delay)
-                    logger.info(f"Retrying in {delay:.1f} seconds...")
+                    delay = random.uniform(
+                        0, min(self.base_delay * (2**attempt), self.max_delay)
+                    )
+                    logger.info("Retrying in %.1f seconds...", delay)
                     await asyncio.sleep(delay)
 
             except Exception as e:
                 last_exception = e
-                logger.error(f"Unexpected error during HTTP request: {e}")
+                logger.error("Unexpected error during HTTP request: %s", e)
                 break
 
         # All retries failed
@@ -2,14 +2,57 @@
 
 import logging
 import re
-from datetime import datetime
-
-import pytz
+import sys
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
 
 from .models import Incident, IncidentStatus, RawIncident
 
 logger = logging.getLogger(__name__)
 
+SEATTLE_TZ = ZoneInfo("America/Los_Angeles")
+
+_PRIORITY_RE = re.compile(r"\d+")
+_UNIT_DELIMITER_RE = re.compile(r"[,;]+")
+
+
+def _parse_canonical_datetime(datetime_str: str) -> datetime | None:
+    """Parse the canonical "M/D/YYYY H:MM:SS AM/PM" form without strptime.
+
+    Returns None when the string isn't in exactly that shape so the caller
+    can fall back to strptime.
+    """
+    parts = datetime_str.split(" ")
+    if len(parts) != 3 or parts[2] not in ("AM", "PM"):
+        return None
+    date_fields = parts[0].split("/")
+    time_fields = parts[1].split(":")
+    if len(date_fields) != 3 or len(time_fields) != 3:
+        return None
+    short_fields = (date_fields[0], date_fields[1], *time_fields)
+    if (
+        len(date_fields[2]) != 4
+        or not all(0 < len(field) <= 2 for field in short_fields)
+        or not all(
+            field.isascii() and field.isdigit()
+            for field in (*short_fields, date_fields[2])
+        )
+    ):
+        return None
+
+    month, day, year = map(int, date_fields)
+    hour, minute, second = map(int, time_fields)
+    if not 1 <= hour <= 12:
+        return None
+    hour %= 12
+    if parts[2] == "PM":
+        hour += 12
+
+    try:
+        return datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return None
+
 
 class NormalizationError(Exception):
     """Exception raised when data normalization fails."""
@@ -22,13 +65,17 @@ class IncidentNormalizer:
 
     def __init__(self):
         """Initialize the normalizer."""
-        self.seattle_tz = pytz.timezone("America/Los_Angeles")
+        self.seattle_tz = SEATTLE_TZ
 
-    def normalize_incident(self, raw_incident: RawIncident) -> Incident:
+    def normalize_incident(
+        self, raw_incident: RawIncident, now: datetime | None = None
+    ) -> Incident:
         """Normalize a raw incident into a structured Incident.
 
         Args:
             raw_incident: Raw incident data from HTML parsing
+            now: Naive UTC time to record as first/last seen; pass one value
+                for a whole batch to avoid reading the clock per incident
 
         Returns:
             Normalized Incident object
@@ -47,15 +94,19 @@ class IncidentNormalizer:
             units = self._parse_units(raw_incident.units_str)
 
             # Current time for tracking
-            now = datetime.utcnow()
+            if now is None:
+                now = datetime.utcnow()
 
-            return Incident(
+            # Every field is already parsed and cleaned above (and RawIncident
+            # validated the strings), so skip re-validating the model
+            return Incident.model_construct(
                 incident_id=raw_incident.incident_id,
                 incident_datetime=incident_datetime,
                 priority=priority,
                 units=units,
                 address=raw_incident.address,
-                incident_type=raw_incident.incident_type,
+                # Low-cardinality, so share one string object across the cache
+                incident_type=sys.intern(raw_incident.incident_type),
                 status=IncidentStatus.ACTIVE,  # New incidents are active
                 first_seen=now,
                 last_seen=now,
@@ -82,17 +133,15 @@ class IncidentNormalizer:
         if not datetime_str:
             raise NormalizationError("Empty datetime string")
 
+        # Fast path for the format the SFD page always uses
+        dt = _parse_canonical_datetime(datetime_str)
+        if dt is not None:
+            return self._to_utc(dt)
+
         try:
             # Try common format: "9/17/2025 8:39:31 PM"
             dt = datetime.strptime(datetime_str, "%m/%d/%Y %I:%M:%S %p")
-
-            # Localize to Seattle timezone
-            seattle_dt = self.seattle_tz.localize(dt)
-
-            # Convert to UTC
-            utc_dt = seattle_dt.astimezone(pytz.UTC).replace(tzinfo=None)
-
-            return utc_dt
+            return self._to_utc(dt)
 
         except ValueError as e:
             # Try alternative formats
@@ -105,14 +154,25 @@ class IncidentNormalizer:
             for fmt in alternative_formats:
                 try:
                     dt = datetime.strptime(datetime_str, fmt)
-                    seattle_dt = self.seattle_tz.localize(dt)
-                    utc_dt = seattle_dt.astimezone(pytz.UTC).replace(tzinfo=None)
-                    return utc_dt
+                    return self._to_utc(dt)
                 except ValueError:
                     continue
 
             raise NormalizationError(f"Unable to parse datetime: {datetime_str}") from e
 
+    def _to_utc(self, dt: datetime) -> datetime:
+        """Convert a naive Seattle local time to a naive UTC datetime.
+
+        Ambiguous fall-back and skipped spring-forward times resolve to
+        standard time (PST), matching pytz's ``localize(is_dst=False)``.
+        """
+        local = dt.replace(tzinfo=self.seattle_tz)
+        if local.dst():
+            # fold=1 picks the second (PST) occurrence of a repeated hour and
+            # is a no-op for unambiguous daylight times
+            local = local.replace(fold=1)
+        return local.astimezone(UTC).replace(tzinfo=None)
+
     def _parse_priority(self, priority_str: str) -> int:
         """Parse priority string to integer.
 
@@ -133,12 +193,15 @@ class IncidentNormalizer:
             cleaned = priority_str.strip()
 
             # Extract first number found
-            match = re.search(r"\d+", cleaned)
-            if match:
-                return int(match.group())
-            else:
+            match = _PRIORITY_RE.search(cleaned)
+            if not match:
                 raise NormalizationError(f"No number found in priority: {priority_str}")
 
+            priority = int(match.group())
+            if not 1 <= priority <= 10:
+                raise NormalizationError(f"Priority out of range: {priority_str}")
+            return priority
+
         except (ValueError, AttributeError) as e:
             raise NormalizationError(f"Unable to parse priority: {priority_str}") from e
 
@@ -165,27 +228,22 @@ class IncidentNormalizer:
             # Split on common delimiters and clean each unit
             units = []
 
-            # Split on spaces first
-            parts = re.split(r"\s+", cleaned)
-
-            for part in parts:
-                if not part:
-                    continue
-
-                # Remove trailing asterisks and other symbols
-                unit = re.sub(r"[*]+$", "", part)
+            # Split on whitespace first
+            for part in cleaned.split():
+                # Remove trailing asterisks
+                unit = part.rstrip("*")
 
                 # Further split on other delimiters if needed
-                sub_units = re.split(r"[,;]+", unit)
+                sub_units = _UNIT_DELIMITER_RE.split(unit)
 
                 for sub_unit in sub_units:
                     sub_unit = sub_unit.strip()
                     if sub_unit and len(sub_unit) > 0:
-                        units.append(sub_unit)
+                        units.append(sys.intern(sub_unit))
 
             return units
 
         except Exception as e:
-            logger.warning(f"Error parsing units '{units_str}': {e}")
+            logger.warning("Error parsing units '%s': %s", units_str, e)
             # Return the original string as a single unit if parsing fails
             return [units_str.strip()] if units_str.strip() else []
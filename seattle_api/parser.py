@@ -2,14 +2,18 @@
 
 import logging
 import re
+from zoneinfo import ZoneInfo
 
-import pytz
 from bs4 import BeautifulSoup, Tag
 
 from .models import RawIncident
 
 logger = logging.getLogger(__name__)
 
+# M/D/YYYY H:MM:SS AM/PM
+_DATETIME_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}:\d{2}\s+[AP]M")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class HTMLParseError(Exception):
     """Exception raised when HTML parsing fails."""
@@ -22,7 +26,7 @@ class IncidentHTMLParser:
 
     def __init__(self):
         """Initialize the HTML parser."""
-        self.seattle_tz = pytz.timezone("America/Los_Angeles")
+        self.seattle_tz = ZoneInfo("America/Los_Angeles")
 
     def parse_incidents(self, html_content: str) -> list[RawIncident]:
         """Parse incidents from HTML content.
@@ -64,20 +68,19 @@ class IncidentHTMLParser:
                     incidents.append(incident)
                 else:
                     failed_rows += 1
-                    logger.debug(f"Row {i + 1} did not produce a valid incident")
+                    logger.debug("Row %d did not produce a valid incident", i + 1)
             except Exception as e:
                 failed_rows += 1
-                logger.warning(f"Failed to parse incident row {i + 1}: {e}")
+                logger.warning("Failed to parse incident row %d: %s", i + 1, e)
                 # Log the row content for debugging (but limit length)
-                try:
-                    row_text = (
-                        row.get_text()[:200] + "..."
-                        if len(row.get_text()) > 200
-                        else row.get_text()
-                    )
-                    logger.debug(f"Problematic row content: {row_text}")
-                except Exception:
-                    logger.debug("Could not extract row content for debugging")
+                if logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        row_text = row.get_text()
+                        if len(row_text) > 200:
+                            row_text = row_text[:200] + "..."
+                        logger.debug("Problematic row content: %s", row_text)
+                    except Exception:
+                        logger.debug("Could not extract row content for debugging")
                 continue
 
         if failed_rows > 0:
@@ -152,7 +155,7 @@ class IncidentHTMLParser:
         """
         cells = row.find_all("td")
         if len(cells) < 6:
-            logger.warning(f"Incident row has only {len(cells)} cells, expected 6")
+            logger.warning("Incident row has only %d cells, expected 6", len(cells))
             return None
 
         try:
@@ -185,7 +188,7 @@ class IncidentHTMLParser:
             )
 
         except Exception as e:
-            logger.error(f"Error parsing incident row: {e}")
+            logger.error("Error parsing incident row: %s", e)
             return None
 
     def _looks_like_datetime(self, text: str) -> bool:
@@ -201,9 +204,7 @@ class IncidentHTMLParser:
             return False
 
         # Look for common datetime patterns
-        # M/D/YYYY H:MM:SS AM/PM
-        datetime_pattern = r"\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}:\d{2}\s+[AP]M"
-        return bool(re.search(datetime_pattern, text))
+        return bool(_DATETIME_RE.search(text))
 
     def _clean_datetime_string(self, datetime_str: str) -> str:
         """Clean and normalize datetime string.
@@ -215,7 +216,7 @@ class IncidentHTMLParser:
             Cleaned datetime string
         """
         # Remove extra whitespace and normalize
-        cleaned = re.sub(r"\s+", " ", datetime_str.strip())
+        cleaned = _WHITESPACE_RE.sub(" ", datetime_str.strip())
         return cleaned
 
     def _clean_units_string(self, units_str: str) -> str:
@@ -228,7 +229,7 @@ class IncidentHTMLParser:
             Cleaned units string
         """
         # Remove extra whitespace
-        cleaned = re.sub(r"\s+", " ", units_str.strip())
+        cleaned = _WHITESPACE_RE.sub(" ", units_str.strip())
         return cleaned
 
     def _clean_address_string(self, address: str) -> str:
@@ -241,7 +242,7 @@ class IncidentHTMLParser:
             Cleaned address string
         """
         # Remove extra whitespace and normalize
-        cleaned = re.sub(r"\s+", " ", address.strip())
+        cleaned = _WHITESPACE_RE.sub(" ", address.strip())
         return cleaned
 
     def _clean_incident_type_string(self, incident_type: str) -> str:
@@ -254,5 +255,5 @@ class IncidentHTMLParser:
             Cleaned incident type string
         """
         # Remove extra whitespace
-        cleaned = re.sub(r"\s+", " ", incident_type.strip())
+        cleaned = _WHITESPACE_RE.sub(" ", incident_type.strip())
         return cleaned
@@ -240,14 +240,19 @@ class IncidentPoller:
 
                 # Normalize incidents (with individual error handling)
                 normalization_errors = 0
+                seen_at = datetime.utcnow()
                 for raw_incident in raw_incidents:
                     try:
-                        incident = self.normalizer.normalize_incident(raw_incident)
+                        incident = self.normalizer.normalize_incident(
+                            raw_incident, now=seen_at
+                        )
                         incidents.append(incident)
                     except Exception as e:
                         normalization_errors += 1
                         logger.warning(
-                            f"Failed to normalize incident {raw_incident.incident_id}: {e}"
+                            "Failed to normalize incident %s: %s",
+                            raw_incident.incident_id,
+                            e,
                         )
                         continue
 
@@ -432,9 +437,9 @@ class IncidentPoller:
                     await asyncio.get_event_loop().run_in_executor(
                         None, self.cache.add_incident, closed_incident
                     )
-                    logger.debug(f"Marked incident {incident_id} as closed")
+                    logger.debug("Marked incident %s as closed", incident_id)
             except Exception as e:
-                logger.warning(f"Failed to close incident {incident_id}: {e}")
+                logger.warning("Failed to close incident %s: %s", incident_id, e)
 
     async def _polling_loop(self) -> None:
         """Main polling loop with error handling and backoff."""
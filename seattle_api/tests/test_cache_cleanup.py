@@ -1,7 +1,7 @@
 """Tests for incident cache cleanup and retention functionality."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
@@ -592,3 +592,46 @@ class TestEdgeCases:
         # Test that shutdown handles cleanup properly
         await cache.shutdown()
         assert not cache._cleanup_running
+
+    def test_cleanup_ignores_stale_expiry_entries(self, cache_with_short_retention):
+        """Test that re-closing an incident supersedes its earlier expiry entry."""
+        cache = cache_with_short_retention
+        old_time = datetime.utcnow() - timedelta(hours=3)
+        incident = Incident(
+            incident_id="F230000010",
+            incident_datetime=old_time,
+            priority=1,
+            units=["E1"],
+            address="Reclosed Address",
+            incident_type="Test",
+            status=IncidentStatus.CLOSED,
+            first_seen=old_time,
+            last_seen=old_time,
+            closed_at=old_time,
+        )
+        cache.add_incident(incident)
+        cache.add_incident(incident)  # Duplicate index entry for same closure
+
+        # Re-closed recently: the old expiry entry must not evict it
+        recent = incident.model_copy(update={"closed_at": datetime.utcnow()})
+        cache.add_incident(recent)
+
+        assert cache.cleanup_expired() == 0
+        assert cache.get_incident("F230000010") is not None
+
+    def test_cleanup_handles_timezone_aware_closed_at(
+        self, cache_with_short_retention, expired_incident
+    ):
+        """Test that aware and naive closed_at values expire consistently."""
+        cache = cache_with_short_retention
+        aware_expired = expired_incident.model_copy(
+            update={
+                "incident_id": "F230000011",
+                "closed_at": datetime.now(UTC) - timedelta(hours=3),
+            }
+        )
+        cache.add_incident(expired_incident)
+        cache.add_incident(aware_expired)
+
+        assert cache.cleanup_expired() == 2
+        assert len(cache.get_all_incidents()) == 0
@@ -201,11 +201,17 @@ class TestSeattleHTTPClient:
         with patch.object(httpx.AsyncClient, "get") as mock_get:
             mock_get.side_effect = timeout_error
 
-            with patch("asyncio.sleep") as mock_sleep:
+            with (
+                patch("asyncio.sleep") as mock_sleep,
+                patch(
+                    "seattle_api.http_client.random.uniform",
+                    side_effect=lambda a, b: b,
+                ),
+            ):
                 with pytest.raises(HTTPClientError):
                     await http_client.fetch_incident_html()
 
-                # Check that delays increase exponentially
+                # Check that jitter caps increase exponentially
                 sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
                 assert len(sleep_calls) == 3  # max_retries
                 assert sleep_calls[0] == 1.0  # base_delay * 2^0
@@ -227,7 +233,7 @@ class TestSeattleHTTPClient:
 
                 # Check that delay is capped
                 sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
-                assert all(delay <= http_client.max_delay for delay in sleep_calls)
+                assert all(0 <= delay <= http_client.max_delay for delay in sleep_calls)
 
     def test_is_valid_html_response(self, http_client):
         """Test HTML response validation."""
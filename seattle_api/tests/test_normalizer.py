@@ -5,7 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
-from seattle_api.models import IncidentStatus, RawIncident
+from seattle_api.models import Incident, IncidentStatus, RawIncident
 from seattle_api.normalizer import IncidentNormalizer, NormalizationError
 
 
@@ -30,8 +30,9 @@ class TestIncidentNormalizer:
         with patch("seattle_api.normalizer.datetime") as mock_datetime:
             mock_now = datetime(2025, 9, 17, 20, 39, 31)
             mock_datetime.utcnow.return_value = mock_now
-            # Also need to allow strptime to work normally
+            # Also need to allow parsing and construction to work normally
             mock_datetime.strptime = datetime.strptime
+            mock_datetime.side_effect = datetime
 
             incident = self.normalizer.normalize_incident(raw_incident)
 
@@ -69,6 +70,50 @@ class TestIncidentNormalizer:
         assert dt.day in [18]  # Next day due to timezone conversion
         assert dt.year == 2025
 
+    def test_parse_datetime_fast_path_matches_strptime(self):
+        """Test that the canonical fast path agrees with strptime parsing."""
+        samples = [
+            "9/17/2025 8:39:31 PM",
+            "12/1/2025 12:00:00 AM",
+            "1/31/2025 12:05:09 PM",
+            "03/07/2025 07:15:00 AM",
+        ]
+        for sample in samples:
+            expected = self.normalizer._to_utc(
+                datetime.strptime(sample, "%m/%d/%Y %I:%M:%S %p")
+            )
+            assert self.normalizer._parse_datetime(sample) == expected
+
+    def test_parse_datetime_fast_path_rejects_invalid_date(self):
+        """Test that out-of-range values still raise NormalizationError."""
+        with pytest.raises(NormalizationError, match="Unable to parse datetime"):
+            self.normalizer._parse_datetime("2/30/2025 8:39:31 PM")
+
+        with pytest.raises(NormalizationError, match="Unable to parse datetime"):
+            self.normalizer._parse_datetime("9/17/2025 13:39:31 PM")
+
+    def test_parse_datetime_applies_daylight_saving_offset(self):
+        """Test that Pacific DST and standard offsets are both honoured."""
+        summer = self.normalizer._parse_datetime("7/1/2025 12:00:00 PM")
+        winter = self.normalizer._parse_datetime("1/15/2025 12:00:00 PM")
+
+        assert summer == datetime(2025, 7, 1, 19, 0, 0)  # PDT, UTC-7
+        assert winter == datetime(2025, 1, 15, 20, 0, 0)  # PST, UTC-8
+
+    @pytest.mark.parametrize(
+        "dt_str, expected",
+        [
+            # 1:30 AM happens twice on 11/2/2025; the PST occurrence is used
+            ("11/2/2025 1:30:00 AM", datetime(2025, 11, 2, 9, 30, 0)),
+            # 2:30 AM is skipped on 3/9/2025; it is read as PST
+            ("3/9/2025 2:30:00 AM", datetime(2025, 3, 9, 10, 30, 0)),
+        ],
+        ids=["fall-back-ambiguous", "spring-forward-gap"],
+    )
+    def test_parse_datetime_dst_transitions_use_standard_time(self, dt_str, expected):
+        """Test that DST transition times resolve to PST like pytz is_dst=False."""
+        assert self.normalizer._parse_datetime(dt_str) == expected
+
     def test_parse_datetime_two_digit_year(self):
         """Test parsing datetime with 2-digit year."""
         dt = self.normalizer._parse_datetime("9/17/25 8:39:31 PM")
@@ -168,6 +213,29 @@ class TestIncidentNormalizer:
         with pytest.raises(NormalizationError, match="Failed to normalize incident"):
             self.normalizer.normalize_incident(raw_incident)
 
+    def test_parse_priority_out_of_range(self):
+        """Test that priorities outside 1-10 are rejected."""
+        with pytest.raises(NormalizationError, match="Priority out of range"):
+            self.normalizer._parse_priority("0")
+
+        with pytest.raises(NormalizationError, match="Priority out of range"):
+            self.normalizer._parse_priority("11")
+
+    def test_normalized_incident_round_trips_through_validation(self):
+        """Test that the unvalidated model matches a fully validated one."""
+        raw_incident = RawIncident(
+            datetime_str="9/17/2025 8:39:31 PM",
+            incident_id="F250129499",
+            priority_str="1",
+            units_str="E25* L10",
+            address="515 Minor Ave",
+            incident_type="Auto Fire Alarm",
+        )
+
+        incident = self.normalizer.normalize_incident(raw_incident)
+
+        assert Incident.model_validate(incident.model_dump()) == incident
+
     def test_parse_units_fallback_behavior(self):
         """Test units parsing fallback behavior when parsing fails."""
         # This should not raise an exception, but return the original string
@@ -213,8 +281,9 @@ class TestIncidentNormalizer:
         with patch("seattle_api.normalizer.datetime") as mock_datetime:
             mock_now = datetime(2025, 9, 17, 20, 39, 31)
             mock_datetime.utcnow.return_value = mock_now
-            # Also need to allow strptime to work normally
+            # Also need to allow parsing and construction to work normally
             mock_datetime.strptime = datetime.strptime
+            mock_datetime.side_effect = datetime
 
             incident = self.normalizer.normalize_incident(raw_incident)
 
@@ -222,6 +291,42 @@ class TestIncidentNormalizer:
             assert incident.address == "515 Minor Ave Suite 100"
             assert incident.incident_type == "Auto Fire Alarm - Commercial"
 
+    def test_normalize_incident_uses_supplied_now(self):
+        """Test that a batch timestamp is used for first/last seen."""
+        raw_incident = RawIncident(
+            datetime_str="9/17/2025 8:39:31 PM",
+            incident_id="F250129499",
+            priority_str="1",
+            units_str="E25",
+            address="515 Minor Ave",
+            incident_type="Auto Fire Alarm",
+        )
+        seen_at = datetime(2025, 9, 18, 3, 40, 0)
+
+        incident = self.normalizer.normalize_incident(raw_incident, now=seen_at)
+
+        assert incident.first_seen == seen_at
+        assert incident.last_seen == seen_at
+
+    def test_normalize_incident_interns_repeated_strings(self):
+        """Test that incident types and units are shared across incidents."""
+        incidents = [
+            self.normalizer.normalize_incident(
+                RawIncident(
+                    datetime_str="9/17/2025 8:39:31 PM",
+                    incident_id=incident_id,
+                    priority_str="1",
+                    units_str="".join(["E", "25"]),
+                    address="515 Minor Ave",
+                    incident_type="".join(["Aid ", "Response"]),
+                )
+            )
+            for incident_id in ("F1", "F2")
+        ]
+
+        assert incidents[0].incident_type is incidents[1].incident_type
+        assert incidents[0].units[0] is incidents[1].units[0]
+
     def test_edge_case_midnight_conversion(self):
         """Test timezone conversion around midnight."""
         # Test conversion that might cross date boundaries
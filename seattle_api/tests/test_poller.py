@@ -1,7 +1,7 @@
 """Tests for the incident poller."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -168,7 +168,7 @@ class TestIncidentPoller:
 
             mock_http_client.fetch_incident_html.assert_called_once()
             mock_parse.assert_called_once_with(sample_html)
-            mock_normalize.assert_called_once_with(sample_raw_incident)
+            mock_normalize.assert_called_once_with(sample_raw_incident, now=ANY)
             mock_update.assert_called_once_with([sample_incident])
 
     @pytest.mark.asyncio